@@ -66,7 +66,7 @@ class QueueTimesClient:
             response.raise_for_status()
             data = response.json()
 
-            rides = self._parse_rides(data, park_id, park_name)
+            rides = self._parse_rides(data, park_id, park_name, park_slug)
 
             return Park(
                 id=park_id,
@@ -86,7 +86,7 @@ class QueueTimesClient:
         return None
 
     def _parse_rides(
-        self, data: dict[str, Any], park_id: int, park_name: str
+        self, data: dict[str, Any], park_id: int, park_name: str, park_slug: str
     ) -> list[Ride]:
         """Parse ride data from API response.
 
@@ -117,6 +117,7 @@ class QueueTimesClient:
                     is_open=ride_data.get("is_open", False),
                     park_id=park_id,
                     park_name=park_name,
+                    park_slug=park_slug,
                 )
                 rides.append(ride)
 
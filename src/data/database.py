@@ -17,6 +17,9 @@ class WaitTimesDatabase:
         self.db_path = Path(db_path)
         self.retention_days = retention_days
 
+        # Bumped whenever wait_times changes, so readers can cache queries
+        self.waits_version = 0
+
         # Ensure directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -114,6 +117,7 @@ class WaitTimesDatabase:
                 ))
 
             conn.commit()
+            self.waits_version += 1
             logger.debug(f"Stored {len(rides)} wait time records")
 
     def store_weather(self, temperature: float, condition: str,
@@ -139,7 +143,8 @@ class WaitTimesDatabase:
         """Get the most recent wait times for all rides.
 
         Returns:
-            List of dicts with ride info and wait times
+            List of dicts with ride info and wait times, ordered by park
+            name, then longest wait first
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
@@ -289,6 +294,8 @@ class WaitTimesDatabase:
             weather_deleted = cursor.rowcount
 
             conn.commit()
+            if wait_deleted > 0:
+                self.waits_version += 1
 
             if wait_deleted > 0 or weather_deleted > 0:
                 logger.info(
@@ -0,0 +1,28 @@
+"""Batched blitting helpers."""
+
+import pygame
+
+
+def blit_batch(
+    target: pygame.Surface,
+    sequence: list[tuple[pygame.Surface, tuple[int, int]]],
+    special_flags: int = 0,
+) -> None:
+    """Blit a sequence of (source, dest) pairs in a single call.
+
+    Uses pygame-ce's ``fblits`` when available and falls back to
+    ``blits`` on upstream pygame.
+
+    Args:
+        target: Surface to blit onto
+        sequence: List of (source surface, destination position) pairs
+        special_flags: Blend flags applied to every blit
+    """
+    fblits = getattr(target, "fblits", None)
+    if fblits is not None:
+        fblits(sequence, special_flags)
+    else:
+        target.blits(
+            [(source, dest, None, special_flags) for source, dest in sequence],
+            doreturn=False,
+        )
@@ -9,12 +9,13 @@ from typing import Optional
 import pygame
 
 from src.models.ride import Ride, WaitTimesData, ClosedPark
-from src.themes.colors import get_color_scheme, get_wait_color, ColorScheme
+from src.themes.colors import get_color_scheme, ColorScheme
 from src.themes.fonts import get_font_manager, FontManager
 from src.themes.images import get_image_manager, ImageManager
 from src.api.weather import WeatherData
 from src.events.scheduler import EventScheduler, ScheduledEvent, EventType
 from src.events.animations import FireworksAnimation, ParadeAnimation, VideoPlayer
+from src.display.blitting import blit_batch
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +36,14 @@ DOT_SPACING = 16
 STATUS_WARNING = (255, 193, 7)   # Amber for stale data
 STATUS_ERROR = (220, 53, 69)     # Red for errors
 
+# Sizes drawn in per-ride themed fonts (ride and closed-park cards); these
+# are preloaded for every theme at startup
+THEMED_FONT_SIZES = (28, 36, 80)
+
+# Fixed simulation step; long stalls are capped so updates can catch up
+FIXED_DT = 1.0 / 60.0
+MAX_FRAME_DT = 0.25
+
 
 @dataclass
 class DisplayConfig:
@@ -57,6 +66,9 @@ class RideDisplay:
         self.clock: Optional[pygame.time.Clock] = None
         self.running = False
 
+        # Monotonic timestamp of the current frame, taken once per loop
+        self._frame_time: float = time_module.monotonic()
+
         # Theme managers (initialized in setup)
         self.font_manager: Optional[FontManager] = None
         self.image_manager: Optional[ImageManager] = None
@@ -72,6 +84,7 @@ class RideDisplay:
 
         # Data state tracking
         self.last_data_update: Optional[datetime] = None
+        self.last_data_update_mono: Optional[float] = None  # time.monotonic() basis
         self.data_is_stale: bool = False
         self.last_error: Optional[str] = None
 
@@ -89,7 +102,7 @@ class RideDisplay:
         self.active_event: Optional[ScheduledEvent] = None
         self.fireworks_animation: Optional[FireworksAnimation] = None
         self.parade_animation: Optional[ParadeAnimation] = None
-        self.event_start_time: float = 0.0
+        self.event_start_time: float = 0.0  # time.monotonic() basis
         # Video players for events (keyed by park_slug + event_type)
         self.event_videos: dict[str, VideoPlayer] = {}
         self.current_video_player: Optional[VideoPlayer] = None
@@ -115,17 +128,27 @@ class RideDisplay:
 
             # Initialize theme managers with error handling
             try:
-                self.font_manager = get_font_manager()
+                self.font_manager = get_font_manager(THEMED_FONT_SIZES)
             except Exception as e:
                 logger.error(f"Failed to initialize font manager: {e}")
                 self.font_manager = None
 
             try:
-                self.image_manager = get_image_manager()
+                self.image_manager = get_image_manager(
+                    (self.config.width, self.config.height)
+                )
             except Exception as e:
                 logger.error(f"Failed to initialize image manager: {e}")
                 self.image_manager = None
 
+            # Load, convert and scale ride images now that the display mode
+            # is set, so the first round of cards doesn't do it per frame
+            if self.image_manager:
+                try:
+                    self.image_manager.preload_all()
+                except Exception as e:
+                    logger.warning(f"Failed to preload images: {e}")
+
             # Fallback font
             self.font_small = pygame.font.Font(None, 24)
 
@@ -152,7 +175,15 @@ class RideDisplay:
 
         # Update data freshness tracking
         self.last_data_update = data.last_fetch
-        self.data_is_stale = data.is_stale
+        now = datetime.now()
+        if data.last_fetch is not None:
+            # Rebase the fetch time onto the monotonic clock once, so the
+            # per-frame age checks avoid datetime arithmetic
+            fetch_age = (now - data.last_fetch).total_seconds()
+            self.last_data_update_mono = time_module.monotonic() - fetch_age
+        else:
+            self.last_data_update_mono = None
+        self.data_is_stale, _ = data.status(now)
 
         if not data.fetch_success:
             self.last_error = data.error_message
@@ -195,10 +226,9 @@ class RideDisplay:
 
     def _get_data_age_minutes(self) -> int:
         """Get age of current data in minutes."""
-        if self.last_data_update is None:
+        if self.last_data_update_mono is None:
             return -1
-        age = datetime.now() - self.last_data_update
-        return int(age.total_seconds() / 60)
+        return int((self._frame_time - self.last_data_update_mono) / 60)
 
     def _draw_weather_icon(self, surface: pygame.Surface, icon_code: str, x: int, y: int, size: int = 40):
         """Draw a weather icon at the specified position.
@@ -300,10 +330,8 @@ class RideDisplay:
         """Get a full-screen image for a ride."""
         if self.image_manager:
             try:
-                img = self.image_manager.get_image(ride_name, theme)
-                # Scale to fill screen
-                return pygame.transform.smoothscale(
-                    img, (self.config.width, self.config.height)
+                return self._fit_to_screen(
+                    self.image_manager.get_image(ride_name, theme)
                 )
             except Exception as e:
                 logger.warning(f"Image error for {ride_name}: {e}")
@@ -311,6 +339,17 @@ class RideDisplay:
         # Create gradient fallback
         return self._create_gradient_background(theme)
 
+    def _fit_to_screen(self, image: pygame.Surface) -> pygame.Surface:
+        """Scale an image to fill the screen, unless it already does.
+
+        Images from the image manager are normally prescaled at load, so
+        this is a no-op on the render path.
+        """
+        size = (self.config.width, self.config.height)
+        if image.get_size() == size:
+            return image
+        return pygame.transform.smoothscale(image, size)
+
     def _create_gradient_background(self, theme: str) -> pygame.Surface:
         """Create a gradient background based on theme colors."""
         colors = get_color_scheme(theme)
@@ -369,8 +408,7 @@ class RideDisplay:
         content_width = self.config.width - weather_width - 40  # padding
 
         # Render wait time (large, on left side of content area)
-        wait_color = get_wait_color(ride.wait_category)
-        wait_surface = font_wait_time.render(ride.display_wait, True, wait_color)
+        wait_surface = font_wait_time.render(ride.display_wait, True, ride.wait_color)
         wait_x = 30
         wait_y = bar_y + 5  # Tight to top
         surface.blit(wait_surface, (wait_x, wait_y))
@@ -425,11 +463,7 @@ class RideDisplay:
             park_image = self.image_manager.get_park_image(park.slug)
 
         if park_image:
-            # Scale to fill screen
-            bg_image = pygame.transform.smoothscale(
-                park_image, (self.config.width, self.config.height)
-            )
-            surface.blit(bg_image, (0, 0))
+            surface.blit(self._fit_to_screen(park_image), (0, 0))
         else:
             # Use gradient fallback
             bg_image = self._create_gradient_background(theme)
@@ -623,10 +657,7 @@ class RideDisplay:
                 park_image = self.image_manager.get_park_image(event.park_slug)
 
             if park_image:
-                bg_image = pygame.transform.smoothscale(
-                    park_image, (self.config.width, self.config.height)
-                )
-                surface.blit(bg_image, (0, 0))
+                surface.blit(self._fit_to_screen(park_image), (0, 0))
             else:
                 bg_image = self._create_gradient_background("classic")
                 surface.blit(bg_image, (0, 0))
@@ -761,11 +792,18 @@ class RideDisplay:
         return surface
 
     def _render_display_item(self, item) -> pygame.Surface:
-        """Render a display item (Ride or ClosedPark)."""
+        """Render a display item (Ride or ClosedPark).
+
+        Cards are full-screen and opaque, so they are converted to the
+        display format here; every later blit (including the per-frame
+        alpha blit during transitions) is then a same-format copy that
+        takes SDL's fast path instead of per-pixel blending.
+        """
         if isinstance(item, ClosedPark):
-            return self._render_closed_park_card(item)
+            surface = self._render_closed_park_card(item)
         else:
-            return self._render_ride_card(item)
+            surface = self._render_ride_card(item)
+        return surface.convert()
 
     def _start_transition(self):
         """Begin transition to next item."""
@@ -775,14 +813,18 @@ class RideDisplay:
         self.transitioning = True
         self.transition_progress = 0.0
 
-        self.prev_surface = self._render_display_item(self.display_items[self.current_index])
+        self.prev_surface = self._render_display_item(
+            self.display_items[self.current_index]
+        )
         self.current_index = (self.current_index + 1) % len(self.display_items)
 
         # Advance image cycles after completing a full round
         if self.current_index == 0 and self.image_manager:
             self.image_manager.advance_all_cycles()
 
-        self.next_surface = self._render_display_item(self.display_items[self.current_index])
+        self.next_surface = self._render_display_item(
+            self.display_items[self.current_index]
+        )
 
     def _update_transition(self, dt: float):
         """Update transition animation."""
@@ -799,9 +841,8 @@ class RideDisplay:
 
     def update(self, dt: float):
         """Update display state."""
-        if self.last_data_update:
-            age = datetime.now() - self.last_data_update
-            self.data_is_stale = age.total_seconds() > 900
+        if self.last_data_update_mono is not None:
+            self.data_is_stale = self._frame_time - self.last_data_update_mono > 900
 
         # Check for active events
         if self.event_scheduler:
@@ -810,7 +851,7 @@ class RideDisplay:
             if current_event and not self.active_event:
                 # Event just started
                 self.active_event = current_event
-                self.event_start_time = time_module.time()
+                self.event_start_time = self._frame_time
                 # Reset animations and video
                 if self.fireworks_animation:
                     self.fireworks_animation.reset()
@@ -830,7 +871,7 @@ class RideDisplay:
 
         # Update animations if event is active
         if self.active_event:
-            elapsed = time_module.time() - self.event_start_time
+            elapsed = self._frame_time - self.event_start_time
             # Check for video first
             video_key = f"{self.active_event.park_slug}_{self.active_event.event_type.value}"
             if video_key in self.event_videos:
@@ -857,17 +898,21 @@ class RideDisplay:
         try:
             # Check if event is active
             if self.active_event:
-                elapsed = time_module.time() - self.event_start_time
+                elapsed = self._frame_time - self.event_start_time
                 surface = self._render_event_screen(self.active_event, elapsed)
                 self.screen.blit(surface, (0, 0))
             elif not self.display_items:
                 surface = self._render_no_rides()
                 self.screen.blit(surface, (0, 0))
             elif self.transitioning and self.prev_surface and self.next_surface:
+                # Surface alpha keeps the blend inside SDL's SIMD blitter;
+                # a per-pixel surfarray blend measured ~4x slower at 800x480
                 alpha = int(255 * self.transition_progress)
-                self.screen.blit(self.prev_surface, (0, 0))
                 self.next_surface.set_alpha(alpha)
-                self.screen.blit(self.next_surface, (0, 0))
+                blit_batch(
+                    self.screen,
+                    [(self.prev_surface, (0, 0)), (self.next_surface, (0, 0))],
+                )
                 self.next_surface.set_alpha(255)
             else:
                 surface = self._render_display_item(self.display_items[self.current_index])
@@ -940,15 +985,22 @@ class RideDisplay:
 
         logger.info("Starting display loop")
 
+        # Step state with a constant dt, independent of render frame timing
+        accumulator = 0.0
+
         while self.running:
             try:
-                dt = self.clock.tick(self.config.fps) / 1000.0
+                frame_dt = self.clock.tick(self.config.fps) / 1000.0
+                accumulator += min(frame_dt, MAX_FRAME_DT)
+                self._frame_time = time_module.monotonic()
 
                 if not self.handle_events():
                     self.running = False
                     break
 
-                self.update(dt)
+                while accumulator >= FIXED_DT:
+                    self.update(FIXED_DT)
+                    accumulator -= FIXED_DT
                 self.render()
 
             except Exception as e:
@@ -5,6 +5,8 @@ from typing import Callable
 
 import pygame
 
+from src.display.blitting import blit_batch
+
 
 class TransitionType(Enum):
     """Available transition types."""
@@ -28,10 +30,9 @@ def crossfade(
         progress: Transition progress from 0.0 to 1.0
         target: Surface to render the result to
     """
-    target.blit(prev_surface, (0, 0))
     alpha = int(255 * progress)
     next_surface.set_alpha(alpha)
-    target.blit(next_surface, (0, 0))
+    blit_batch(target, [(prev_surface, (0, 0)), (next_surface, (0, 0))])
     next_surface.set_alpha(255)
 
 
@@ -56,6 +57,21 @@ def slide_left(
     target.blit(next_surface, (width - offset, 0))
 
 
+def _ease_in_out_exact(t: float) -> float:
+    """Quadratic ease-in-out curve (used to build the lookup table)."""
+    if t < 0.5:
+        return 2 * t * t
+    return 1 - (-2 * t + 2) ** 2 / 2
+
+
+# Easing curve sampled at 1024 points; far finer than the 256 alpha levels
+# the result is eventually quantized to
+_EASE_LUT_SIZE = 1024
+_EASE_LUT = tuple(
+    _ease_in_out_exact(i / (_EASE_LUT_SIZE - 1)) for i in range(_EASE_LUT_SIZE)
+)
+
+
 def ease_in_out(t: float) -> float:
     """Smooth easing function for transitions.
 
@@ -65,9 +81,11 @@ def ease_in_out(t: float) -> float:
     Returns:
         Eased progress value
     """
-    if t < 0.5:
-        return 2 * t * t
-    return 1 - pow(-2 * t + 2, 2) / 2
+    if t <= 0.0:
+        return 0.0
+    if t >= 1.0:
+        return 1.0
+    return _EASE_LUT[int(t * (_EASE_LUT_SIZE - 1))]
 
 
 def get_transition_func(
@@ -2,39 +2,61 @@
 
 import math
 import random
-from dataclasses import dataclass, field
+import threading
+from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
 import pygame
 
+from src.display.blitting import blit_batch
+from src.utils.jit import NUMBA_AVAILABLE, njit, prange
 from src.utils.logging_config import get_logger
 
 
-@dataclass
-class Particle:
-    """A single particle in an animation."""
-
-    x: float
-    y: float
-    vx: float
-    vy: float
-    color: tuple[int, int, int]
-    life: float  # 0.0 to 1.0
-    size: float
-    decay: float
+@njit(parallel=True, fastmath=True, cache=True)
+def _step_particles_jit(px, py, pvx, pvy, plife, pdecay, n, dt, gravity):
+    """Integrate particle motion in place (compiled when Numba is available)."""
+    step = dt * 60.0
+    for i in prange(n):
+        px[i] += pvx[i] * step
+        py[i] += pvy[i] * step
+        pvy[i] += gravity
+        plife[i] -= pdecay[i] * step
+
+
+def _step_particles(px, py, pvx, pvy, plife, pdecay, n, dt, gravity):
+    """Integrate the first n particles of a structure-of-arrays pool in place.
+
+    Args:
+        px, py: Particle positions
+        pvx, pvy: Particle velocities
+        plife: Remaining life (0.0 to 1.0)
+        pdecay: Life lost per 60 Hz tick
+        n: Number of live particles at the front of the arrays
+        dt: Delta time (seconds)
+        gravity: Downward acceleration per 60 Hz tick
+    """
+    if NUMBA_AVAILABLE:
+        _step_particles_jit(px, py, pvx, pvy, plife, pdecay, n, dt, gravity)
+        return
+
+    step = dt * 60.0
+    px[:n] += pvx[:n] * step
+    py[:n] += pvy[:n] * step
+    pvy[:n] += gravity
+    plife[:n] -= pdecay[:n] * step
 
 
 @dataclass
 class Firework:
-    """A firework that explodes into particles."""
+    """A rising firework shell; its particles live in the animation's pool."""
 
     x: float
     y: float
     target_y: float
     vy: float
-    color: tuple[int, int, int]
-    exploded: bool = False
-    particles: list[Particle] = field(default_factory=list)
+    color_idx: int  # Index into FireworksAnimation.COLORS
 
 
 class FireworksAnimation:
@@ -52,6 +74,13 @@ class FireworksAnimation:
         (255, 165, 0),    # Orange
     ]
 
+    # Jittered shades per base color, and quantized particle life levels
+    COLOR_VARIANTS = 8
+    LIFE_LEVELS = 16
+
+    # Initial particle pool size (grows by doubling)
+    INITIAL_CAPACITY = 1024
+
     def __init__(self, width: int, height: int):
         """Initialize fireworks animation.
 
@@ -66,6 +95,47 @@ class FireworksAnimation:
         self.last_launch = 0.0
         self.launch_interval = 0.3  # Seconds between launches
         self.gravity = 0.15
+        self._rng = np.random.default_rng()
+
+        # Particles from every explosion, stored as parallel arrays with the
+        # live ones packed at the front
+        self._count = 0
+        self._capacity = 0
+        self._allocate(self.INITIAL_CAPACITY)
+
+        # Compile (or load from cache) the particle kernel now rather than
+        # at the first explosion; same argument types as in update()
+        _step_particles(
+            self._px, self._py, self._pvx, self._pvy,
+            self._plife, self._pdecay, 0, 0.0, self.gravity,
+        )
+
+        # Precomputed colors so rendering never builds color tuples
+        self._trail_colors = [(r // 2, g // 2, b // 2) for r, g, b in self.COLORS]
+        self._life_palette = self._build_life_palette()
+
+    def _allocate(self, capacity: int) -> None:
+        """Resize the particle pool, keeping live particles.
+
+        Args:
+            capacity: New pool capacity
+        """
+        n = self._count
+        for name, dtype in (
+            ("_px", np.float64),
+            ("_py", np.float64),
+            ("_pvx", np.float64),
+            ("_pvy", np.float64),
+            ("_plife", np.float64),
+            ("_pdecay", np.float64),
+            ("_psize", np.float64),
+            ("_pshade", np.intp),
+        ):
+            arr = np.empty(capacity, dtype)
+            if n:
+                arr[:n] = getattr(self, name)[:n]
+            setattr(self, name, arr)
+        self._capacity = capacity
 
     def update(self, dt: float, elapsed_time: float) -> None:
         """Update animation state.
@@ -81,35 +151,46 @@ class FireworksAnimation:
             # Vary launch interval for more natural effect
             self.launch_interval = random.uniform(0.2, 0.6)
 
-        # Update existing fireworks
-        for fw in self.fireworks[:]:
-            if not fw.exploded:
-                # Move firework upward
-                fw.y += fw.vy * dt * 60
-                fw.vy += self.gravity * 0.3  # Slow down
-
-                # Explode when reaching target
-                if fw.y <= fw.target_y or fw.vy >= 0:
-                    self._explode(fw)
-            else:
-                # Update particles
-                for p in fw.particles[:]:
-                    p.x += p.vx * dt * 60
-                    p.y += p.vy * dt * 60
-                    p.vy += self.gravity
-                    p.life -= p.decay * dt * 60
+        # Update particles
+        n = self._count
+        if n:
+            _step_particles(
+                self._px, self._py, self._pvx, self._pvy,
+                self._plife, self._pdecay, n, dt, self.gravity,
+            )
+            self._compact()
 
-                    if p.life <= 0:
-                        fw.particles.remove(p)
+        # Move rising fireworks upward, exploding them at their target
+        rising = []
+        for fw in self.fireworks:
+            fw.y += fw.vy * dt * 60
+            fw.vy += self.gravity * 0.3  # Slow down
 
-                # Remove firework when all particles are gone
-                if not fw.particles:
-                    self.fireworks.remove(fw)
+            if fw.y <= fw.target_y or fw.vy >= 0:
+                self._explode(fw)
+            else:
+                rising.append(fw)
+        self.fireworks = rising
+
+    def _compact(self) -> None:
+        """Drop dead particles, keeping live ones packed at the front."""
+        n = self._count
+        alive = self._plife[:n] > 0
+        live = int(np.count_nonzero(alive))
+        if live == n:
+            return
+
+        for arr in (
+            self._px, self._py, self._pvx, self._pvy,
+            self._plife, self._pdecay, self._psize, self._pshade,
+        ):
+            arr[:live] = arr[:n][alive]
+        self._count = live
 
     def _launch_firework(self) -> None:
         """Launch a new firework from the bottom."""
         x = random.randint(int(self.width * 0.1), int(self.width * 0.9))
-        color = random.choice(self.COLORS)
+        color_idx = random.randrange(len(self.COLORS))
         target_y = random.randint(int(self.height * 0.15), int(self.height * 0.4))
 
         self.fireworks.append(
@@ -118,35 +199,36 @@ class FireworksAnimation:
                 y=self.height + 10,
                 target_y=target_y,
                 vy=-random.uniform(12, 16),
-                color=color,
+                color_idx=color_idx,
             )
         )
 
     def _explode(self, fw: Firework) -> None:
-        """Create explosion particles for a firework."""
-        fw.exploded = True
-        num_particles = random.randint(60, 100)
-
-        for _ in range(num_particles):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 8)
-            # Slight color variation
-            color = tuple(
-                max(0, min(255, c + random.randint(-30, 30))) for c in fw.color
-            )
-
-            fw.particles.append(
-                Particle(
-                    x=fw.x,
-                    y=fw.y,
-                    vx=math.cos(angle) * speed,
-                    vy=math.sin(angle) * speed,
-                    color=color,
-                    life=1.0,
-                    size=random.uniform(2, 4),
-                    decay=random.uniform(0.01, 0.025),
-                )
-            )
+        """Add a firework's explosion particles to the pool."""
+        rng = self._rng
+        num_particles = int(rng.integers(60, 101))
+
+        start = self._count
+        end = start + num_particles
+        if end > self._capacity:
+            self._allocate(max(end, self._capacity * 2))
+
+        # Draw every particle's parameters in one batch per attribute
+        angles = rng.uniform(0, 2 * math.pi, num_particles)
+        speeds = rng.uniform(2, 8, num_particles)
+
+        self._px[start:end] = fw.x
+        self._py[start:end] = fw.y
+        np.multiply(np.cos(angles), speeds, out=self._pvx[start:end])
+        np.multiply(np.sin(angles), speeds, out=self._pvy[start:end])
+        self._plife[start:end] = 1.0
+        self._pdecay[start:end] = rng.uniform(0.01, 0.025, num_particles)
+        self._psize[start:end] = rng.uniform(2, 4, num_particles)
+        # Slight color variation: pick one of the base color's jittered shades
+        self._pshade[start:end] = fw.color_idx * self.COLOR_VARIANTS + rng.integers(
+            0, self.COLOR_VARIANTS, num_particles
+        )
+        self._count = end
 
     def render(self, surface: pygame.Surface) -> None:
         """Render fireworks onto surface.
@@ -155,28 +237,71 @@ class FireworksAnimation:
             surface: Pygame surface to render onto
         """
         for fw in self.fireworks:
-            if not fw.exploded:
-                # Draw rising firework as a small bright dot
-                pygame.draw.circle(surface, fw.color, (int(fw.x), int(fw.y)), 3)
-                # Trail effect
-                trail_color = tuple(c // 2 for c in fw.color)
-                pygame.draw.circle(
-                    surface, trail_color, (int(fw.x), int(fw.y + 5)), 2
-                )
-            else:
-                # Draw particles
-                for p in fw.particles:
-                    alpha = int(p.life * 255)
-                    color = tuple(int(c * p.life) for c in p.color)
-                    size = int(p.size * p.life)
-                    if size > 0:
-                        pygame.draw.circle(
-                            surface, color, (int(p.x), int(p.y)), max(1, size)
-                        )
+            # Draw rising firework as a small bright dot
+            pygame.draw.circle(
+                surface, self.COLORS[fw.color_idx], (int(fw.x), int(fw.y)), 3
+            )
+            # Trail effect
+            pygame.draw.circle(
+                surface,
+                self._trail_colors[fw.color_idx],
+                (int(fw.x), int(fw.y + 5)),
+                2,
+            )
+
+        n = self._count
+        if not n:
+            return
+
+        # Draw particles, fading with remaining life; particles whose
+        # circle lies entirely off screen are culled before any draw call
+        life = self._plife[:n]
+        px = self._px[:n]
+        py = self._py[:n]
+        sizes = (self._psize[:n] * life).astype(np.intp)
+        visible = (
+            (sizes > 0)
+            & (px > -sizes) & (px < self.width + sizes)
+            & (py > -sizes) & (py < self.height + sizes)
+        )
+        levels = (life[visible] * self.LIFE_LEVELS).astype(np.intp)
+
+        palette = self._life_palette
+        draw_circle = pygame.draw.circle
+        for x, y, size, shade, level in zip(
+            px[visible].astype(np.intp).tolist(),
+            py[visible].astype(np.intp).tolist(),
+            sizes[visible].tolist(),
+            self._pshade[:n][visible].tolist(),
+            levels.tolist(),
+        ):
+            draw_circle(surface, palette[shade][level], (x, y), size)
+
+    def _build_life_palette(self) -> list[list[tuple[int, int, int]]]:
+        """Build particle colors for every shade and life level.
+
+        Returns:
+            Palette indexed by [shade][life level], where shades are
+            COLOR_VARIANTS jittered variants of each base color
+        """
+        jitter = self._rng.integers(
+            -30, 31, (len(self.COLORS), self.COLOR_VARIANTS, 3)
+        )
+        shades = np.clip(np.array(self.COLORS)[:, None, :] + jitter, 0, 255)
+
+        levels = self.LIFE_LEVELS
+        return [
+            [
+                (r * level // levels, g * level // levels, b * level // levels)
+                for level in range(levels + 1)
+            ]
+            for r, g, b in shades.reshape(-1, 3).tolist()
+        ]
 
     def reset(self) -> None:
         """Reset animation state."""
         self.fireworks.clear()
+        self._count = 0
         self.last_launch = 0.0
 
 
@@ -210,6 +335,16 @@ class ParadeAnimation:
         (255, 215, 0),    # Gold
     ]
 
+    # Twinkling stars, pre-rendered per size and brightness level
+    STAR_COLOR = (255, 255, 200)
+    STAR_SIZES = range(3, 9)
+    STAR_LEVELS = 8
+
+    # Sparkle banner layout
+    BANNER_HEIGHT = 40
+    NUM_SPARKLES = 20
+    SPARKLE_LEVELS = 16  # Quantized intensity levels for pre-rendered sparkles
+
     def __init__(self, width: int, height: int):
         """Initialize parade animation.
 
@@ -225,6 +360,9 @@ class ParadeAnimation:
         self.spawn_interval = 0.1
         self.banner_offset = 0.0
         self.sparkle_timer = 0.0
+        self._sparkle_i = np.arange(self.NUM_SPARKLES)
+        self._sparkle_sprites = self._build_sparkle_sprites()
+        self._star_sprites = self._build_star_sprites()
 
     def update(self, dt: float, elapsed_time: float) -> None:
         """Update animation state.
@@ -247,7 +385,7 @@ class ParadeAnimation:
         self.sparkle_timer = elapsed_time
 
         # Update existing elements
-        for elem in self.elements[:]:
+        for elem in self.elements:
             elem.x += elem.vx * dt * 60
             elem.y += elem.vy * dt * 60
             elem.rotation += elem.rotation_speed * dt * 60
@@ -256,14 +394,13 @@ class ParadeAnimation:
             if elem.element_type == "balloon":
                 elem.x += math.sin(elapsed_time * 2 + elem.y * 0.05) * 0.5
 
-            # Remove off-screen elements
-            if (
-                elem.x < -50
-                or elem.x > self.width + 50
-                or elem.y < -50
-                or elem.y > self.height + 50
-            ):
-                self.elements.remove(elem)
+        # Remove off-screen elements
+        max_x = self.width + 50
+        max_y = self.height + 50
+        self.elements = [
+            elem for elem in self.elements
+            if -50 <= elem.x <= max_x and -50 <= elem.y <= max_y
+        ]
 
     def _spawn_element(self) -> None:
         """Spawn a new floating element."""
@@ -309,7 +446,7 @@ class ParadeAnimation:
                     y=random.randint(0, int(self.height * 0.6)),
                     vx=0,
                     vy=0,
-                    color=(255, 255, 200),
+                    color=self.STAR_COLOR,
                     element_type="star",
                     size=random.uniform(3, 8),
                 )
@@ -321,14 +458,21 @@ class ParadeAnimation:
         Args:
             surface: Pygame surface to render onto
         """
-        # Draw floating elements
+        # Draw all visible stars in one batch, behind the other elements
+        self._draw_stars(surface)
+
+        # Draw floating elements, skipping those still fully off screen
+        # (elements live until they are 50px past an edge)
+        width = self.width
+        height = self.height
         for elem in self.elements:
+            reach = elem.size * 1.3
+            if not (-reach < elem.x < width + reach and -reach < elem.y < height + reach):
+                continue
             if elem.element_type == "balloon":
                 self._draw_balloon(surface, elem)
             elif elem.element_type == "confetti":
                 self._draw_confetti(surface, elem)
-            elif elem.element_type == "star":
-                self._draw_star(surface, elem)
 
         # Draw sparkle banner at top
         self._draw_banner(surface)
@@ -373,46 +517,112 @@ class ParadeAnimation:
 
         pygame.draw.polygon(surface, elem.color, points)
 
-    def _draw_star(self, surface: pygame.Surface, elem: FloatingElement) -> None:
-        """Draw a twinkling star."""
-        x, y = int(elem.x), int(elem.y)
-        size = int(elem.size)
+    def _draw_stars(self, surface: pygame.Surface) -> None:
+        """Draw all twinkling stars from pre-rendered sprites."""
+        sprites = self._star_sprites
+        min_size = self.STAR_SIZES.start
+        max_level = self.STAR_LEVELS - 1
+        timer = self.sparkle_timer * 8
+
+        blits = []
+        for elem in self.elements:
+            if elem.element_type != "star":
+                continue
+
+            # Twinkle effect based on time
+            twinkle = (math.sin(timer + elem.x + elem.y) + 1) / 2
+            if twinkle < 0.3:
+                continue  # Star is "off"
+
+            sprite = sprites[int(elem.size) - min_size][int(twinkle * max_level)]
+            offset = sprite.get_width() // 2
+            blits.append((sprite, (int(elem.x) - offset, int(elem.y) - offset)))
+
+        blit_batch(surface, blits, pygame.BLEND_PREMULTIPLIED)
 
-        # Twinkle effect based on time
-        twinkle = (math.sin(self.sparkle_timer * 8 + elem.x + elem.y) + 1) / 2
-        if twinkle < 0.3:
-            return  # Star is "off"
+    def _build_star_sprites(self) -> list[list[pygame.Surface]]:
+        """Pre-render star sprites for every size and brightness level.
 
-        alpha = int(twinkle * 255)
-        color = tuple(int(c * twinkle) for c in elem.color)
+        Sprites are drawn opaque on a transparent background, so they are
+        valid premultiplied-alpha images.
 
-        # Draw star shape (simple cross pattern)
-        pygame.draw.line(surface, color, (x - size, y), (x + size, y), 2)
-        pygame.draw.line(surface, color, (x, y - size), (x, y + size), 2)
-        # Diagonal lines (smaller)
-        half = size // 2
-        pygame.draw.line(surface, color, (x - half, y - half), (x + half, y + half), 1)
-        pygame.draw.line(surface, color, (x - half, y + half), (x + half, y - half), 1)
+        Returns:
+            Sprites indexed by [size - min size][brightness level]
+        """
+        sprites = []
+        for size in self.STAR_SIZES:
+            # Pad by one pixel for the 2px-wide arms
+            center = size + 1
+            half = size // 2
+            row = []
+            for level in range(self.STAR_LEVELS):
+                twinkle = level / (self.STAR_LEVELS - 1)
+                color = tuple(int(c * twinkle) for c in self.STAR_COLOR)
+
+                sprite = pygame.Surface((center * 2 + 1, center * 2 + 1), pygame.SRCALPHA)
+                # Draw star shape (simple cross pattern)
+                pygame.draw.line(
+                    sprite, color, (center - size, center), (center + size, center), 2
+                )
+                pygame.draw.line(
+                    sprite, color, (center, center - size), (center, center + size), 2
+                )
+                # Diagonal lines (smaller)
+                pygame.draw.line(
+                    sprite, color,
+                    (center - half, center - half), (center + half, center + half), 1
+                )
+                pygame.draw.line(
+                    sprite, color,
+                    (center - half, center + half), (center + half, center - half), 1
+                )
+                row.append(sprite)
+            sprites.append(row)
+        return sprites
 
     def _draw_banner(self, surface: pygame.Surface) -> None:
         """Draw sparkling banner at top of screen."""
-        banner_height = 40
-        num_sparkles = 20
-
-        for i in range(num_sparkles):
-            x = int((i * self.width / num_sparkles + self.banner_offset) % self.width)
-            y = int(banner_height / 2 + math.sin(self.sparkle_timer * 4 + i) * 10)
-
-            # Sparkle intensity varies
-            intensity = (math.sin(self.sparkle_timer * 6 + i * 0.5) + 1) / 2
-            if intensity > 0.5:
-                color = (
-                    int(255 * intensity),
-                    int(215 * intensity),
-                    int(50 * intensity),
-                )
-                size = int(3 + intensity * 3)
-                pygame.draw.circle(surface, color, (x, y), size)
+        i = self._sparkle_i
+        t = self.sparkle_timer
+
+        xs = (i * self.width / self.NUM_SPARKLES + self.banner_offset) % self.width
+        ys = self.BANNER_HEIGHT / 2 + np.sin(t * 4 + i) * 10
+
+        # Sparkle intensity varies; only the brighter half is drawn
+        intensity = (np.sin(t * 6 + i * 0.5) + 1) / 2
+        visible = intensity > 0.5
+        levels = (intensity[visible] * self.SPARKLE_LEVELS).astype(int)
+
+        sprites = self._sparkle_sprites
+        blits = []
+        for x, y, level in zip(
+            xs[visible].astype(int).tolist(),
+            ys[visible].astype(int).tolist(),
+            levels.tolist(),
+        ):
+            sprite, radius = sprites[level]
+            blits.append((sprite, (x - radius, y - radius)))
+        blit_batch(surface, blits)
+
+    def _build_sparkle_sprites(self) -> list[tuple[pygame.Surface, int]]:
+        """Pre-render banner sparkles for each quantized intensity level.
+
+        Returns:
+            List of (sprite, radius) indexed by intensity level
+        """
+        sprites = []
+        for level in range(self.SPARKLE_LEVELS + 1):
+            intensity = level / self.SPARKLE_LEVELS
+            color = (
+                int(255 * intensity),
+                int(215 * intensity),
+                int(50 * intensity),
+            )
+            radius = int(3 + intensity * 3)
+            sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            sprites.append((sprite, radius))
+        return sprites
 
     def reset(self) -> None:
         """Reset animation state."""
@@ -422,7 +632,15 @@ class ParadeAnimation:
 
 
 class VideoPlayer:
-    """Plays video files with looping support using OpenCV."""
+    """Plays video files with looping support using OpenCV.
+
+    Frames are decoded, resized and converted on a background thread into a
+    small ring of surfaces, so the render loop only has to pick the frame
+    that is due and blit it.
+    """
+
+    # Number of decoded frames held in the ring (including the one on screen)
+    RING_SIZE = 3
 
     def __init__(self, width: int, height: int):
         """Initialize video player.
@@ -438,11 +656,28 @@ class VideoPlayer:
         self.current_video_path: Optional[str] = None
         self.fps = 30
         self.frame_duration = 1.0 / 30
-        self.last_frame_time = 0.0
         self.current_frame: Optional[pygame.Surface] = None
 
+        # Decoded frame ring, filled by the decode thread. Frames in
+        # [_read_idx, _write_idx) are held; _read_idx is the one on screen.
+        # Surfaces are allocated once and overwritten in place.
+        self._ring: list[pygame.Surface] = [
+            pygame.Surface((width, height), 0, 24) for _ in range(self.RING_SIZE)
+        ]
+        self._resize_buf = np.empty((height, width, 3), np.uint8)
+        self._ring_pts: list[float] = [0.0] * self.RING_SIZE
+        self._read_idx = 0
+        self._write_idx = 0
+        # Stream position (frames read or skipped) and latest playback time,
+        # used by the decode thread to skip frames that are already late
+        self._frame_no = 0
+        self._clock = 0.0
+        self._cond = threading.Condition()
+        self._stop = False
+        self._thread: Optional[threading.Thread] = None
+
     def load(self, video_path: str) -> bool:
-        """Load a video file.
+        """Load a video file and start decoding it in the background.
 
         Args:
             video_path: Path to video file
@@ -456,6 +691,10 @@ class VideoPlayer:
             self.logger.error("OpenCV not installed. Run: pip install opencv-python-headless")
             return False
 
+        # Stop any decode thread and capture from an earlier load, so two
+        # threads never fill the same ring
+        self.release()
+
         try:
             self.cap = cv2.VideoCapture(video_path)
             if not self.cap.isOpened():
@@ -465,10 +704,8 @@ class VideoPlayer:
             self.current_video_path = video_path
             self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30
             self.frame_duration = 1.0 / self.fps
-            self.last_frame_time = 0.0
 
-            # Read first frame
-            self._read_next_frame()
+            self._start_decoder()
             self.logger.info(f"Loaded video: {video_path} ({self.fps:.1f} fps)")
             return True
 
@@ -476,11 +713,104 @@ class VideoPlayer:
             self.logger.error(f"Error loading video: {e}")
             return False
 
-    def _read_next_frame(self) -> bool:
-        """Read the next frame from the video.
+    def _start_decoder(self) -> None:
+        """Decode the first frame synchronously, then start the decode thread."""
+        self._read_idx = 0
+        self._write_idx = 0
+        self._frame_no = 0
+        self._clock = 0.0
+        self._stop = False
+        self.current_frame = None
+
+        # Read first frame so there is something to show immediately
+        if not self._read_next_frame(self._ring[0]):
+            return
+        self._ring_pts[0] = 0.0
+        self._write_idx = 1
+        self._frame_no = 1
+        self.current_frame = self._ring[0]
+
+        self._thread = threading.Thread(
+            target=self._decode_loop, daemon=True, name="VideoDecode"
+        )
+        self._thread.start()
+
+    def _stop_decoder(self) -> None:
+        """Stop the decode thread and wait for it to exit."""
+        if self._thread is None:
+            return
+        with self._cond:
+            self._stop = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._thread = None
+
+    def _decode_loop(self) -> None:
+        """Decode frames ahead of playback until stopped (runs on its own thread)."""
+        while True:
+            with self._cond:
+                # Wait for a free slot; never overwrite the frame on screen
+                while (
+                    not self._stop
+                    and self._write_idx - self._read_idx >= self.RING_SIZE
+                ):
+                    self._cond.wait()
+                if self._stop:
+                    return
+                slot = self._write_idx % self.RING_SIZE
+
+            # If playback has moved more than two frames past the stream
+            # position, grab (without decoding) the frames it will never show
+            late_before = self._clock - 2 * self.frame_duration
+            while self._frame_no * self.frame_duration < late_before:
+                if not self._skip_frame():
+                    break
+                self._frame_no += 1
+
+            # The slot is not visible until _write_idx advances, so it can be
+            # filled without holding the lock
+            if not self._read_next_frame(self._ring[slot]):
+                self.logger.warning(f"Video decode stopped: {self.current_video_path}")
+                return
+
+            with self._cond:
+                if self._stop:
+                    return
+                self._ring_pts[slot] = self._frame_no * self.frame_duration
+                self._write_idx += 1
+                self._frame_no += 1
+
+    def _skip_frame(self) -> bool:
+        """Advance past the next frame without decoding it.
+
+        Returns:
+            True if a frame was skipped
+        """
+        try:
+            import cv2
+        except ImportError:
+            return False
+
+        if self.cap is None:
+            return False
+
+        if not self.cap.grab():
+            # Loop back to beginning
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            return self.cap.grab()
+        return True
+
+    def _read_next_frame(self, target: pygame.Surface) -> bool:
+        """Read the next frame from the video into a surface.
+
+        The frame is resized into a preallocated buffer and copied straight
+        into the surface pixels, swapping BGR to RGB in the same pass.
+
+        Args:
+            target: 24-bit display-sized surface to write the frame into
 
         Returns:
-            True if frame was read, False if video ended
+            True if a frame was read
         """
         try:
             import cv2
@@ -498,14 +828,13 @@ class VideoPlayer:
             if not ret:
                 return False
 
-        # Convert BGR to RGB
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
         # Resize to display size
-        frame = cv2.resize(frame, (self.width, self.height))
+        cv2.resize(frame, (self.width, self.height), dst=self._resize_buf)
 
-        # Convert to pygame surface
-        self.current_frame = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
+        # Write into the surface (transpose to x,y and BGR -> RGB)
+        pixels = pygame.surfarray.pixels3d(target)
+        pixels[:] = self._resize_buf.swapaxes(0, 1)[:, :, ::-1]
+        del pixels  # Unlock surface
         return True
 
     def update(self, dt: float, elapsed_time: float) -> None:
@@ -515,10 +844,22 @@ class VideoPlayer:
             dt: Delta time since last frame
             elapsed_time: Total elapsed time since video start
         """
-        # Check if it's time for next frame
-        if elapsed_time - self.last_frame_time >= self.frame_duration:
-            self._read_next_frame()
-            self.last_frame_time = elapsed_time
+        with self._cond:
+            self._clock = elapsed_time
+
+            # Advance to the newest decoded frame that is due, dropping any
+            # older ones the display was too slow to show
+            read_idx = self._read_idx
+            while (
+                self._write_idx - read_idx > 1
+                and self._ring_pts[(read_idx + 1) % self.RING_SIZE] <= elapsed_time
+            ):
+                read_idx += 1
+
+            if read_idx != self._read_idx:
+                self._read_idx = read_idx
+                self.current_frame = self._ring[read_idx % self.RING_SIZE]
+                self._cond.notify()
 
     def render(self, surface: pygame.Surface) -> None:
         """Render current frame to surface.
@@ -534,14 +875,15 @@ class VideoPlayer:
         if self.cap:
             try:
                 import cv2
+                self._stop_decoder()
                 self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                self._read_next_frame()
+                self._start_decoder()
             except Exception:
                 pass
-        self.last_frame_time = 0.0
 
     def release(self) -> None:
         """Release video resources."""
+        self._stop_decoder()
         if self.cap:
             self.cap.release()
             self.cap = None
@@ -1,20 +1,37 @@
 """Event scheduler for fireworks and parades."""
 
-from dataclasses import dataclass
-from datetime import datetime, time, timedelta
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, time
 from enum import Enum
+from types import MappingProxyType
 from typing import Optional
 import re
 
 from src.utils.logging_config import get_logger
 
+_SECONDS_PER_DAY = 86400
+
+# Schedule times are "H:MM" or "HH:MM" with nothing else around them
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})")
+
+
+def _seconds_of_day(value) -> float:
+    """Return a time or datetime's offset from midnight in seconds."""
+    return (
+        value.hour * 3600
+        + value.minute * 60
+        + value.second
+        + value.microsecond / 1_000_000
+    )
+
 
 class EventType(Enum):
     FIREWORKS = "fireworks"
     PARADE = "parade"
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledEvent:
     """Represents a scheduled event (fireworks or parade)."""
 
@@ -24,35 +41,40 @@ class ScheduledEvent:
     start_time: time
     duration_seconds: int
 
+    # Start and end as seconds from midnight, derived from the fields above
+    _start_sod: float = field(init=False, repr=False, compare=False)
+    _end_sod: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._start_sod = _seconds_of_day(self.start_time)
+        self._end_sod = self._start_sod + self.duration_seconds
+
     def is_active_at(self, check_time: datetime) -> bool:
         """Check if this event is active at the given time."""
-        event_start = datetime.combine(check_time.date(), self.start_time)
-        event_end = event_start + timedelta(seconds=self.duration_seconds)
-        return event_start <= check_time < event_end
+        return self._start_sod <= _seconds_of_day(check_time) < self._end_sod
 
     def time_remaining(self, check_time: datetime) -> int:
         """Return seconds remaining in this event, or 0 if not active."""
-        if not self.is_active_at(check_time):
+        t = _seconds_of_day(check_time)
+        if not self._start_sod <= t < self._end_sod:
             return 0
-        event_start = datetime.combine(check_time.date(), self.start_time)
-        event_end = event_start + timedelta(seconds=self.duration_seconds)
-        return int((event_end - check_time).total_seconds())
+        return int(self._end_sod - t)
 
     def elapsed_seconds(self, check_time: datetime) -> int:
         """Return seconds elapsed since event start, or 0 if not active."""
-        if not self.is_active_at(check_time):
+        t = _seconds_of_day(check_time)
+        if not self._start_sod <= t < self._end_sod:
             return 0
-        event_start = datetime.combine(check_time.date(), self.start_time)
-        return int((check_time - event_start).total_seconds())
+        return int(t - self._start_sod)
 
 
 # Mapping from config park names to display names and slugs
-PARK_MAPPING = {
+PARK_MAPPING = MappingProxyType({
     "magic_kingdom": ("Magic Kingdom", "magic-kingdom"),
     "epcot": ("EPCOT", "epcot"),
     "hollywood_studios": ("Hollywood Studios", "hollywood-studios"),
     "animal_kingdom": ("Animal Kingdom", "animal-kingdom"),
-}
+})
 
 
 class EventScheduler:
@@ -65,11 +87,42 @@ class EventScheduler:
             config: Events configuration dict from config.yaml
         """
         self.logger = get_logger(__name__)
-        self.events: list[ScheduledEvent] = []
+        self._events: list[ScheduledEvent] = []
         self._parse_config(config)
+        self._build_index()
+
+    @property
+    def events(self) -> list[ScheduledEvent]:
+        """Scheduled events, in configuration order."""
+        return self._events
+
+    @events.setter
+    def events(self, events: list[ScheduledEvent]) -> None:
+        self._events = events
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """Index events by start time for binary-search lookups.
+
+        Events are sorted by (start second-of-day, config position), so ties
+        resolve to the earlier configured event as a linear scan would.
+        Replace ``events`` wholesale (not in place) to keep the index current.
+        """
+        order = sorted(
+            range(len(self._events)),
+            key=lambda i: (self._events[i]._start_sod, i),
+        )
+        self._sorted_events = [self._events[i] for i in order]
+        self._sorted_positions = order
+        self._start_keys = [event._start_sod for event in self._sorted_events]
+        self._max_duration = max(
+            (event.duration_seconds for event in self._events), default=0
+        )
 
     def _parse_config(self, config: dict) -> None:
         """Parse events configuration into scheduled events."""
+        park_mapping = PARK_MAPPING
+
         # Parse fireworks
         fireworks_config = config.get("fireworks", {})
         if fireworks_config.get("enabled", False):
@@ -77,15 +130,16 @@ class EventScheduler:
             schedule = fireworks_config.get("schedule", {})
 
             for park_key, times in schedule.items():
-                if park_key not in PARK_MAPPING:
+                park = park_mapping.get(park_key)
+                if park is None:
                     self.logger.warning(f"Unknown park in fireworks schedule: {park_key}")
                     continue
 
-                park_name, park_slug = PARK_MAPPING[park_key]
+                park_name, park_slug = park
                 for time_str in times:
                     event_time = self._parse_time(time_str)
                     if event_time:
-                        self.events.append(
+                        self._events.append(
                             ScheduledEvent(
                                 event_type=EventType.FIREWORKS,
                                 park_name=park_name,
@@ -105,15 +159,16 @@ class EventScheduler:
             schedule = parade_config.get("schedule", {})
 
             for park_key, times in schedule.items():
-                if park_key not in PARK_MAPPING:
+                park = park_mapping.get(park_key)
+                if park is None:
                     self.logger.warning(f"Unknown park in parade schedule: {park_key}")
                     continue
 
-                park_name, park_slug = PARK_MAPPING[park_key]
+                park_name, park_slug = park
                 for time_str in times:
                     event_time = self._parse_time(time_str)
                     if event_time:
-                        self.events.append(
+                        self._events.append(
                             ScheduledEvent(
                                 event_type=EventType.PARADE,
                                 park_name=park_name,
@@ -128,7 +183,7 @@ class EventScheduler:
 
     def _parse_time(self, time_str: str) -> Optional[time]:
         """Parse time string in HH:MM format."""
-        match = re.match(r"(\d{1,2}):(\d{2})", time_str)
+        match = _TIME_RE.fullmatch(time_str)
         if match:
             hour, minute = int(match.group(1)), int(match.group(2))
             if 0 <= hour <= 23 and 0 <= minute <= 59:
@@ -148,10 +203,24 @@ class EventScheduler:
         if check_time is None:
             check_time = datetime.now()
 
-        for event in self.events:
-            if event.is_active_at(check_time):
-                return event
-        return None
+        t = _seconds_of_day(check_time)
+        keys = self._start_keys
+        events = self._sorted_events
+        positions = self._sorted_positions
+
+        # Only events starting in (t - longest duration, t] can be active;
+        # with overlaps, the earliest configured one wins
+        active = None
+        idx = bisect_right(keys, t) - 1
+        while idx >= 0 and keys[idx] > t - self._max_duration:
+            event = events[idx]
+            if event.is_active_at(check_time) and (
+                active is None or positions[idx] < positions[active]
+            ):
+                active = idx
+            idx -= 1
+
+        return events[active] if active is not None else None
 
     def get_next_event(self, check_time: Optional[datetime] = None) -> Optional[tuple[ScheduledEvent, int]]:
         """Get the next upcoming event and seconds until it starts.
@@ -165,23 +234,19 @@ class EventScheduler:
         if check_time is None:
             check_time = datetime.now()
 
-        next_event = None
-        min_seconds = float("inf")
-
-        for event in self.events:
-            event_start = datetime.combine(check_time.date(), event.start_time)
+        if not self._sorted_events:
+            return None
 
-            # If event already passed today, check tomorrow
-            if event_start <= check_time:
-                event_start = datetime.combine(
-                    check_time.date() + timedelta(days=1), event.start_time
-                )
+        # First event starting strictly after now; wrap to tomorrow's first
+        t = _seconds_of_day(check_time)
+        idx = bisect_right(self._start_keys, t)
+        if idx == len(self._sorted_events):
+            idx = 0
+        next_event = self._sorted_events[idx]
 
-            seconds_until = (event_start - check_time).total_seconds()
-            if seconds_until < min_seconds:
-                min_seconds = seconds_until
-                next_event = event
+        # If event already passed today, it is next tomorrow
+        seconds_until = next_event._start_sod - t
+        if seconds_until <= 0:
+            seconds_until += _SECONDS_PER_DAY
 
-        if next_event:
-            return (next_event, int(min_seconds))
-        return None
+        return (next_event, int(seconds_until))
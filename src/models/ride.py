@@ -1,15 +1,38 @@
 """Data models for rides and parks."""
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Optional
 
+from src.themes.colors import Color, WAIT_COLORS
+
 # TEST MODE: Set park slugs to simulate as closed (empty list = normal operation)
 # Examples: ["magic_kingdom"], ["magic_kingdom", "epcot"], ["magic_kingdom", "epcot", "hollywood_studios", "animal_kingdom"]
 TEST_CLOSED_PARKS: list[str] = []
 
+# Wait time categories: up to 20, 45 and 75 minutes, then anything longer
+WAIT_CATEGORY_LIMITS = (20, 45, 75)
+WAIT_CATEGORIES = ("short", "moderate", "long", "very_long")
+
+# Typical park opening times (Eastern Time)
+DEFAULT_PARK_OPENS = MappingProxyType({
+    "magic_kingdom": "9:00 AM",
+    "epcot": "9:00 AM",
+    "hollywood_studios": "8:30 AM",
+    "animal_kingdom": "8:00 AM",
+})
+
+# Data older than this is flagged as stale
+STALE_AFTER = timedelta(minutes=15)
 
-@dataclass
+# Display order for open rides: by park, longest wait first
+_RIDE_SORT_KEY = attrgetter("park_name", "_neg_wait")
+
+
+@dataclass(slots=True)
 class Ride:
     """Represents a single ride/attraction."""
 
@@ -19,37 +42,39 @@ class Ride:
     is_open: bool
     park_id: int
     park_name: str
+    park_slug: Optional[str] = None  # Key into WaitTimesData.parks
     last_updated: datetime = field(default_factory=datetime.now)
 
     # Theme information (populated from theme mappings)
     theme_id: Optional[str] = None  # e.g., "space_mountain", "haunted_mansion"
 
-    @property
-    def wait_category(self) -> str:
-        """Return wait time category for color coding."""
-        if self.wait_time <= 20:
-            return "short"
-        elif self.wait_time <= 45:
-            return "moderate"
-        elif self.wait_time <= 75:
-            return "long"
-        else:
-            return "very_long"
-
-    @property
-    def display_wait(self) -> str:
-        """Format wait time for display."""
+    # Derived from wait_time and is_open at construction
+    wait_category: str = field(init=False, repr=False, compare=False)
+    wait_color: Color = field(init=False, repr=False, compare=False)
+    display_wait: str = field(init=False, repr=False, compare=False)
+    _neg_wait: int = field(init=False, repr=False, compare=False)  # Sort key
+
+    def __post_init__(self):
+        # Wait time category for color coding
+        self.wait_category = WAIT_CATEGORIES[
+            bisect_left(WAIT_CATEGORY_LIMITS, self.wait_time)
+        ]
+        self.wait_color = WAIT_COLORS[self.wait_category]
+        self._neg_wait = -self.wait_time
+
+        # Formatted wait time for display
         if not self.is_open:
-            return "Closed"
-        if self.wait_time == 0:
-            return "Walk On"
-        return f"{self.wait_time} min"
+            self.display_wait = "Closed"
+        elif self.wait_time == 0:
+            self.display_wait = "Walk On"
+        else:
+            self.display_wait = f"{self.wait_time} min"
 
     def __repr__(self) -> str:
         return f"Ride({self.name}, {self.display_wait}, {self.park_name})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Park:
     """Represents a Disney park."""
 
@@ -68,7 +93,7 @@ class Park:
         return f"Park({self.name}, {len(self.rides)} rides)"
 
 
-@dataclass
+@dataclass(slots=True)
 class ClosedPark:
     """Represents a closed park for display purposes."""
 
@@ -85,7 +110,7 @@ class ClosedPark:
         return f"ClosedPark({self.name}, opens: {self.opens_at})"
 
 
-@dataclass
+@dataclass(slots=True)
 class WaitTimesData:
     """Container for all wait times data."""
 
@@ -94,68 +119,117 @@ class WaitTimesData:
     fetch_success: bool = False
     error_message: Optional[str] = None
 
+    # Derived lists, reused while last_fetch is the same object. A fetch
+    # assigns a new last_fetch, which invalidates them; the cached lists are
+    # shared, so callers must not mutate them.
+    _cache_token: Optional[datetime] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cached_open_rides: Optional[list[Ride]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cached_closed: Optional[list[ClosedPark]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cached_display: Optional[list] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _cache_valid(self) -> bool:
+        """Check whether cached lists belong to the current fetch."""
+        if self.last_fetch is None:
+            return False
+        if self._cache_token is not self.last_fetch:
+            self._cache_token = self.last_fetch
+            self._cached_open_rides = None
+            self._cached_closed = None
+            self._cached_display = None
+        return True
+
     @property
     def all_open_rides(self) -> list[Ride]:
         """Get all open rides across all parks, sorted by park then wait time."""
+        cacheable = self._cache_valid()
+        if cacheable and self._cached_open_rides is not None:
+            return self._cached_open_rides
+
         rides = []
         for park in self.parks.values():
             rides.extend(park.open_rides)
         # Sort by park name, then by wait time descending
-        return sorted(rides, key=lambda r: (r.park_name, -r.wait_time))
+        rides.sort(key=_RIDE_SORT_KEY)
+
+        if cacheable:
+            self._cached_open_rides = rides
+        return rides
+
+    def status(self, now: Optional[datetime] = None) -> tuple[bool, int]:
+        """Return staleness and age of the data from a single clock read.
+
+        Args:
+            now: Current time (defaults to datetime.now())
+
+        Returns:
+            Tuple of (is_stale, age_minutes); age is -1 if never fetched
+        """
+        if self.last_fetch is None:
+            return True, -1
+        if now is None:
+            now = datetime.now()
+        age = now - self.last_fetch
+        return age > STALE_AFTER, int(age.total_seconds() / 60)
 
     @property
     def is_stale(self) -> bool:
         """Check if data is more than 15 minutes old."""
-        if self.last_fetch is None:
-            return True
-        age = datetime.now() - self.last_fetch
-        return age.total_seconds() > 900  # 15 minutes
+        return self.status()[0]
 
     @property
     def age_minutes(self) -> int:
         """Return age of data in minutes."""
-        if self.last_fetch is None:
-            return -1
-        age = datetime.now() - self.last_fetch
-        return int(age.total_seconds() / 60)
+        return self.status()[1]
 
     @property
     def closed_parks(self) -> list[ClosedPark]:
         """Get parks that have no open rides (likely closed)."""
-        # Typical park opening times (Eastern Time)
-        default_opens = {
-            "magic_kingdom": "9:00 AM",
-            "epcot": "9:00 AM",
-            "hollywood_studios": "8:30 AM",
-            "animal_kingdom": "8:00 AM",
-        }
+        cacheable = self._cache_valid()
+        if cacheable and self._cached_closed is not None:
+            return self._cached_closed
 
         closed = []
         for slug, park in self.parks.items():
             # Check if park is actually closed OR in test mode
             is_closed = not park.open_rides or slug in TEST_CLOSED_PARKS
             if is_closed:
-                opens_at = default_opens.get(slug, "9:00 AM")
+                opens_at = DEFAULT_PARK_OPENS.get(slug, "9:00 AM")
                 closed.append(ClosedPark(
                     name=park.name,
                     slug=slug,
                     opens_at=opens_at
                 ))
+
+        if cacheable:
+            self._cached_closed = closed
         return closed
 
     def get_display_items(self) -> list:
         """Get all items to display: open rides + closed parks."""
+        cacheable = self._cache_valid()
+        if cacheable and self._cached_display is not None:
+            return self._cached_display
+
         items = []
+        # Rides built without a slug fall back to a lookup by park name
+        name_to_slug = {park.name: slug for slug, park in self.parks.items()}
         # Add open rides (excluding test-closed parks)
         for ride in self.all_open_rides:
             # Check if this ride's park is in test closed mode
-            park_slug = None
-            for slug, park in self.parks.items():
-                if park.name == ride.park_name:
-                    park_slug = slug
-                    break
+            park_slug = ride.park_slug or name_to_slug.get(ride.park_name)
             if park_slug not in TEST_CLOSED_PARKS:
                 items.append(ride)
         # Add closed parks
         items.extend(self.closed_parks)
+
+        if cacheable:
+            self._cached_display = items
         return items
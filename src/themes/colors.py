@@ -1,13 +1,16 @@
 """Color schemes for ride theming."""
 
 from dataclasses import dataclass
-from typing import Optional
+from types import MappingProxyType
+from typing import Optional, Union
+
+import numpy as np
 
 # Type alias for RGB colors
 Color = tuple[int, int, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorScheme:
     """Color scheme for a ride display."""
 
@@ -24,15 +27,15 @@ class ColorScheme:
 
 
 # Wait time colors (universal across all themes)
-WAIT_COLORS = {
+WAIT_COLORS = MappingProxyType({
     "short": (46, 204, 113),      # Green: 0-20 min
     "moderate": (241, 196, 15),    # Yellow: 21-45 min
     "long": (230, 126, 34),        # Orange: 46-75 min
     "very_long": (231, 76, 60),    # Red: 76+ min
-}
+})
 
 # Theme color schemes
-THEME_COLORS = {
+THEME_COLORS = MappingProxyType({
     "scifi": ColorScheme(
         background=(10, 10, 25),
         accent=(76, 201, 240),      # Bright cyan
@@ -85,13 +88,15 @@ THEME_COLORS = {
         background=(20, 20, 30),
         accent=(255, 215, 0),       # Classic gold
     ),
-}
+})
 
 # Default scheme
 DEFAULT_SCHEME = THEME_COLORS["classic"]
 
 
-def get_color_scheme(theme: str) -> ColorScheme:
+def get_color_scheme(
+    theme: str, _schemes=THEME_COLORS, _default=DEFAULT_SCHEME
+) -> ColorScheme:
     """Get the color scheme for a theme.
 
     Args:
@@ -100,10 +105,13 @@ def get_color_scheme(theme: str) -> ColorScheme:
     Returns:
         ColorScheme instance
     """
-    return THEME_COLORS.get(theme, DEFAULT_SCHEME)
+    # The underscore defaults bind the tables as fast locals
+    return _schemes.get(theme, _default)
 
 
-def get_wait_color(category: str) -> Color:
+def get_wait_color(
+    category: str, _colors=WAIT_COLORS, _default=WAIT_COLORS["moderate"]
+) -> Color:
     """Get the color for a wait time category.
 
     Args:
@@ -112,56 +120,121 @@ def get_wait_color(category: str) -> Color:
     Returns:
         RGB color tuple
     """
-    return WAIT_COLORS.get(category, WAIT_COLORS["moderate"])
+    # The underscore defaults bind the table as fast locals
+    return _colors.get(category, _default)
 
 
-def blend_colors(color1: Color, color2: Color, ratio: float = 0.5) -> Color:
+def blend_colors(
+    color1: Union[Color, np.ndarray],
+    color2: Union[Color, np.ndarray],
+    ratio: float = 0.5,
+) -> Union[Color, np.ndarray]:
     """Blend two colors together.
 
     Args:
-        color1: First RGB color
-        color2: Second RGB color
+        color1: First RGB color (or (N, 3) array of colors)
+        color2: Second RGB color (or (N, 3) array of colors)
         ratio: Blend ratio (0.0 = all color1, 1.0 = all color2)
 
     Returns:
-        Blended RGB color
+        Blended RGB color, or a uint8 array when given arrays
     """
+    if isinstance(color1, np.ndarray) or isinstance(color2, np.ndarray):
+        return blend_colors_batch(color1, color2, ratio)
+    # 8-bit fixed-point weights keep the per-channel math in integers
+    r = int(ratio * 256)
+    ir = 256 - r
     return (
-        int(color1[0] * (1 - ratio) + color2[0] * ratio),
-        int(color1[1] * (1 - ratio) + color2[1] * ratio),
-        int(color1[2] * (1 - ratio) + color2[2] * ratio),
+        (color1[0] * ir + color2[0] * r) >> 8,
+        (color1[1] * ir + color2[1] * r) >> 8,
+        (color1[2] * ir + color2[2] * r) >> 8,
     )
 
 
-def darken(color: Color, amount: float = 0.3) -> Color:
+def darken(
+    color: Union[Color, np.ndarray], amount: float = 0.3
+) -> Union[Color, np.ndarray]:
     """Darken a color.
 
     Args:
-        color: RGB color
+        color: RGB color (or (N, 3) array of colors)
         amount: Darkening amount (0.0 = no change, 1.0 = black)
 
     Returns:
-        Darkened RGB color
+        Darkened RGB color, or a uint8 array when given an array
     """
+    if isinstance(color, np.ndarray):
+        return darken_batch(color, amount)
+    keep = 256 - int(amount * 256)
     return (
-        int(color[0] * (1 - amount)),
-        int(color[1] * (1 - amount)),
-        int(color[2] * (1 - amount)),
+        color[0] * keep >> 8,
+        color[1] * keep >> 8,
+        color[2] * keep >> 8,
     )
 
 
-def lighten(color: Color, amount: float = 0.3) -> Color:
+def lighten(
+    color: Union[Color, np.ndarray], amount: float = 0.3
+) -> Union[Color, np.ndarray]:
     """Lighten a color.
 
     Args:
-        color: RGB color
+        color: RGB color (or (N, 3) array of colors)
         amount: Lightening amount (0.0 = no change, 1.0 = white)
 
     Returns:
-        Lightened RGB color
+        Lightened RGB color, or a uint8 array when given an array
     """
+    if isinstance(color, np.ndarray):
+        return lighten_batch(color, amount)
+    a = int(amount * 256)
     return (
-        int(color[0] + (255 - color[0]) * amount),
-        int(color[1] + (255 - color[1]) * amount),
-        int(color[2] + (255 - color[2]) * amount),
+        color[0] + ((255 - color[0]) * a >> 8),
+        color[1] + ((255 - color[1]) * a >> 8),
+        color[2] + ((255 - color[2]) * a >> 8),
     )
+
+
+def blend_colors_batch(
+    colors1: np.ndarray, colors2: np.ndarray, ratio: float = 0.5
+) -> np.ndarray:
+    """Blend arrays of colors together.
+
+    Args:
+        colors1: (N, 3) array of RGB colors
+        colors2: (N, 3) array of RGB colors (or a single color to broadcast)
+        ratio: Blend ratio (0.0 = all colors1, 1.0 = all colors2)
+
+    Returns:
+        (N, 3) uint8 array of blended colors
+    """
+    return (
+        np.asarray(colors1) * (1 - ratio) + np.asarray(colors2) * ratio
+    ).astype(np.uint8)
+
+
+def darken_batch(colors: np.ndarray, amount: float = 0.3) -> np.ndarray:
+    """Darken an array of colors.
+
+    Args:
+        colors: (N, 3) array of RGB colors
+        amount: Darkening amount (0.0 = no change, 1.0 = black)
+
+    Returns:
+        (N, 3) uint8 array of darkened colors
+    """
+    return (np.asarray(colors) * (1 - amount)).astype(np.uint8)
+
+
+def lighten_batch(colors: np.ndarray, amount: float = 0.3) -> np.ndarray:
+    """Lighten an array of colors.
+
+    Args:
+        colors: (N, 3) array of RGB colors
+        amount: Lightening amount (0.0 = no change, 1.0 = white)
+
+    Returns:
+        (N, 3) uint8 array of lightened colors
+    """
+    colors = np.asarray(colors, dtype=np.float64)
+    return (colors + (255 - colors) * amount).astype(np.uint8)
@@ -1,10 +1,16 @@
 """Font mappings for ride theming."""
 
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterable, Optional
 
-import pygame
+from src.utils.matching import PatternMatcher
+
+if TYPE_CHECKING:
+    import pygame
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +18,7 @@ logger = logging.getLogger(__name__)
 FONTS_DIR = Path(__file__).parent.parent.parent / "assets" / "fonts"
 
 # Available font files
-FONT_FILES = {
+FONT_FILES = MappingProxyType({
     "orbitron": "Orbitron-Bold.ttf",
     "creepster": "Creepster-Regular.ttf",
     "pirata": "PirataOne-Regular.ttf",
@@ -23,10 +29,10 @@ FONT_FILES = {
     "cinzel": "Cinzel-Bold.ttf",
     "exo2": "Exo2-Bold.ttf",
     "audiowide": "Audiowide-Regular.ttf",
-}
+})
 
 # Theme categories for font selection
-FONT_THEMES = {
+FONT_THEMES = MappingProxyType({
     "scifi": "orbitron",       # Space Mountain, TRON, Test Track
     "spooky": "creepster",     # Haunted Mansion, Tower of Terror
     "pirate": "pirata",        # Pirates of the Caribbean
@@ -39,11 +45,11 @@ FONT_THEMES = {
     "starwars": "audiowide",   # Star Wars rides
     "avatar": "exo2",          # Pandora rides
     "classic": "cinzel",       # Classic Disney rides
-}
+})
 
 # Ride name to theme mapping (partial matches supported)
 # The key is searched within the ride name (case-insensitive)
-RIDE_THEME_MAP = {
+RIDE_THEME_MAP = MappingProxyType({
     # Magic Kingdom - Tomorrowland
     "space mountain": "scifi",
     "tron": "scifi",
@@ -168,32 +174,76 @@ RIDE_THEME_MAP = {
     "celebrity spotlight": "playful",
     "adventurers outpost": "adventure",
     "meet beloved": "classic",
-}
+})
 
 # Default theme for rides not in the map
 DEFAULT_THEME = "classic"
 
+# Single-pass matcher over RIDE_THEME_MAP (first entry in map order wins)
+_THEME_MATCHER = PatternMatcher(RIDE_THEME_MAP)
+
+
+@lru_cache(maxsize=256)
+def _classify(name_lower: str) -> str:
+    """Return the theme for a lowercased ride name.
+
+    Ride names come from a small fixed set, so each is matched once. Call
+    ``_classify.cache_clear()`` if RIDE_THEME_MAP is ever changed at runtime.
+    """
+    return _THEME_MATCHER.match(name_lower, DEFAULT_THEME)
+
 
 class FontManager:
     """Manages loading and caching of themed fonts."""
 
-    def __init__(self):
-        self._font_cache: dict[tuple[str, int], pygame.font.Font] = {}
+    def __init__(self, preload_sizes: Iterable[int] = ()):
+        """Initialize the font manager.
+
+        Args:
+            preload_sizes: Font sizes to load up front for every themed font,
+                so the first frames don't stall parsing TTF files
+        """
+        # pygame is imported here rather than at module level, so theme
+        # lookups (get_theme_for_ride, the maps) don't pay its startup cost
+        import pygame
+
+        self._pygame = pygame
+
+        # Loaded fonts by font id, then size ("_system" holds fallbacks)
+        self._font_cache: dict[str, dict[int, "pygame.font.Font"]] = {}
         self._available_fonts: set[str] = set()
+        self._font_paths: dict[str, str] = {}
         self._check_available_fonts()
+        self._preload(preload_sizes)
 
     def _check_available_fonts(self):
-        """Check which font files are available."""
+        """Check which font files are available and resolve their paths."""
+        fonts_dir = str(FONTS_DIR)
         for font_id, filename in FONT_FILES.items():
-            path = FONTS_DIR / filename
-            if path.exists():
+            path = os.path.join(fonts_dir, filename)
+            if os.path.exists(path):
                 self._available_fonts.add(font_id)
+                self._font_paths[font_id] = path
                 logger.debug(f"Font available: {font_id}")
             else:
                 logger.warning(f"Font file not found: {filename}")
 
         logger.info(f"Loaded {len(self._available_fonts)} fonts")
 
+    def _preload(self, sizes: Iterable[int]) -> None:
+        """Load every themed font at the given sizes into the cache."""
+        sizes = tuple(sizes)
+        if not sizes:
+            return
+
+        # One theme per distinct font file
+        themes = {font_id: theme for theme, font_id in FONT_THEMES.items()}
+        for theme in themes.values():
+            for size in sizes:
+                self.get_font(theme, size)
+
+        logger.info(f"Preloaded {len(themes)} fonts at sizes {sizes}")
+
     def get_theme_for_ride(self, ride_name: str) -> str:
         """Determine the theme for a ride based on its name.
 
@@ -203,20 +253,14 @@ class FontManager:
         Returns:
             Theme identifier string
         """
-        ride_lower = ride_name.lower()
-
-        for pattern, theme in RIDE_THEME_MAP.items():
-            if pattern in ride_lower:
-                return theme
-
-        return DEFAULT_THEME
+        return _classify(ride_name.lower())
 
     def get_font(
         self,
         theme: str,
         size: int,
         fallback: bool = True
-    ) -> pygame.font.Font:
+    ) -> "pygame.font.Font":
         """Get a pygame font for the specified theme and size.
 
         Args:
@@ -228,32 +272,34 @@ class FontManager:
             pygame.font.Font instance
         """
         font_id = FONT_THEMES.get(theme, FONT_THEMES[DEFAULT_THEME])
-        cache_key = (font_id, size)
 
         # Check cache
-        if cache_key in self._font_cache:
-            return self._font_cache[cache_key]
+        by_size = self._font_cache.get(font_id)
+        if by_size is not None:
+            font = by_size.get(size)
+            if font is not None:
+                return font
 
         # Try to load themed font
         if font_id in self._available_fonts:
-            font_path = FONTS_DIR / FONT_FILES[font_id]
             try:
-                font = pygame.font.Font(str(font_path), size)
-                self._font_cache[cache_key] = font
+                font = self._pygame.font.Font(self._font_paths[font_id], size)
+                self._font_cache.setdefault(font_id, {})[size] = font
                 return font
-            except pygame.error as e:
+            except self._pygame.error as e:
                 logger.warning(f"Failed to load font {font_id}: {e}")
 
         # Fallback to system font
         if fallback:
-            fallback_key = ("_system", size)
-            if fallback_key not in self._font_cache:
-                self._font_cache[fallback_key] = pygame.font.Font(None, size)
-            return self._font_cache[fallback_key]
+            system_fonts = self._font_cache.setdefault("_system", {})
+            font = system_fonts.get(size)
+            if font is None:
+                font = system_fonts[size] = self._pygame.font.Font(None, size)
+            return font
 
         raise ValueError(f"Font not available: {font_id}")
 
-    def get_font_for_ride(self, ride_name: str, size: int) -> pygame.font.Font:
+    def get_font_for_ride(self, ride_name: str, size: int) -> "pygame.font.Font":
         """Get the appropriate font for a specific ride.
 
         Args:
@@ -271,9 +317,13 @@ class FontManager:
 _font_manager: Optional[FontManager] = None
 
 
-def get_font_manager() -> FontManager:
-    """Get the global FontManager instance."""
+def get_font_manager(preload_sizes: Iterable[int] = ()) -> FontManager:
+    """Get the global FontManager instance.
+
+    Args:
+        preload_sizes: Sizes to preload when the instance is first created
+    """
     global _font_manager
     if _font_manager is None:
-        _font_manager = FontManager()
+        _font_manager = FontManager(preload_sizes)
     return _font_manager
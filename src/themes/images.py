@@ -2,13 +2,19 @@
 
 import logging
 import math
-import random
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pygame
 
 from src.themes.colors import get_color_scheme
+from src.utils.jit import NUMBA_AVAILABLE, njit, prange
+from src.utils.matching import PatternMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +24,9 @@ IMAGES_DIR = Path(__file__).parent.parent.parent / "assets" / "images"
 # Full screen image size
 SCREEN_SIZE = (800, 480)
 
+# Image file types loaded from ride folders
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".webp"})
+
 # Ride name to image folder mapping
 RIDE_IMAGE_MAP = {
     # Magic Kingdom
@@ -134,120 +143,312 @@ RIDE_IMAGE_MAP = {
     "ariel at her grotto": "meet_ariel",
 }
 
+# Single-pass matcher over RIDE_IMAGE_MAP (first entry in map order wins)
+_FOLDER_MATCHER = PatternMatcher(RIDE_IMAGE_MAP)
+
+
+def _circle_offsets(radius: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the pixel offsets pygame.draw.circle fills for a radius."""
+    size = radius * 2 + 1
+    stamp = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(stamp, (255, 255, 255, 255), (radius, radius), radius)
+    dx, dy = np.nonzero(pygame.surfarray.array_alpha(stamp))
+    return dx - radius, dy - radius
+
+
+@lru_cache(maxsize=32)
+def _alpha_colors(rgb: tuple) -> tuple[pygame.Color, ...]:
+    """Return an RGB color at every alpha 0-255, indexed by alpha.
+
+    Built once per color, so draw calls reuse Colors instead of packing a
+    new RGBA tuple each time. Shared between callers; don't modify them.
+    """
+    return tuple(pygame.Color(*rgb, alpha) for alpha in range(256))
+
+
+# Placeholder themes drawn on a per-pixel alpha canvas (see _create_placeholder)
+_ALPHA_THEMES = frozenset({"scifi", "spooky", "avatar", "pirate", "whimsical", "playful"})
+
+# Four-pointed star outline: fixed offsets plus offsets scaled by star size
+_STAR_FIXED = np.array([(0, 0), (2, 0), (0, 0), (2, 2), (0, 0), (-2, 2), (0, 0), (-2, 0)])
+_STAR_SCALED = np.array([(0, -1), (0, 0), (1, 0), (0, 0), (0, 1), (0, 0), (-1, 0), (0, 0)])
+
+# Footprint of the radius-2 circles avatar stems are drawn from
+_STEM_DX, _STEM_DY = _circle_offsets(2)
+
+
+@lru_cache(maxsize=512)
+def _folder_for_ride(name_lower: str) -> str:
+    """Return the image folder for a lowercased ride name."""
+    return _FOLDER_MATCHER.match(name_lower, "generic")
+
+
+@njit(parallel=True, cache=True)
+def _fill_gradient(pixels, r1, g1, b1, r2, g2, b2):
+    """Fill a surfarray (x, y, rgb) view with the diagonal placeholder gradient.
+
+    Compiled with Numba when it is installed; callers use the NumPy path
+    otherwise.
+    """
+    width = pixels.shape[0]
+    height = pixels.shape[1]
+    total = width + height
+    for x in prange(width):
+        for y in range(height):
+            ratio = (x + y) / total
+            inv = 1.0 - ratio
+            pixels[x, y, 0] = min(255, max(0, int(r1 * inv + r2 * ratio * 0.4)))
+            pixels[x, y, 1] = min(255, max(0, int(g1 * inv + g2 * ratio * 0.4)))
+            pixels[x, y, 2] = min(255, max(0, int(b1 * inv + b2 * ratio * 0.4)))
+
 
 class ImageManager:
     """Manages loading and caching of ride images."""
 
-    def __init__(self):
-        self._image_cache: dict[str, list[pygame.Surface]] = {}
+    def __init__(
+        self,
+        prescale: bool = True,
+        target_size: tuple[int, int] = SCREEN_SIZE,
+        max_cached_folders: Optional[int] = None,
+    ):
+        """Initialize the image manager.
+
+        Args:
+            prescale: Scale images to target_size once at load, so callers
+                can blit them without scaling every frame
+            target_size: Display size images and placeholders are made for
+            max_cached_folders: Most ride folders to keep loaded, evicting the
+                least recently used; None keeps every folder. The display
+                cycles through rides in order, so a cap below the number of
+                rides shown reloads images from disk on every visit
+        """
+        self.prescale = prescale
+        self.target_size = tuple(target_size)
+        self.max_cached_folders = max_cached_folders
+        # Loaded images by folder, least recently used first
+        self._image_cache: OrderedDict[str, list[pygame.Surface]] = OrderedDict()
         self._placeholder_cache: dict[str, pygame.Surface] = {}
         self._cycle_index: dict[str, int] = {}
+        self._park_path_cache: dict[str, Optional[Path]] = {}
+        self._park_image_cache: dict[str, Optional[pygame.Surface]] = {}
+        # Folders loaded before a display mode existed, converted on first use
+        self._unconverted: set[str] = set()
+
+        if NUMBA_AVAILABLE:
+            # Compile (or load from cache) the gradient kernel now rather
+            # than on the first placeholder; the strided view matches the
+            # layout of a pixels3d array
+            _fill_gradient(np.zeros((2, 2, 4), np.uint8)[:, :, :3], 0, 0, 0, 0, 0, 0)
 
     def _get_folder_for_ride(self, ride_name: str) -> str:
         """Get the image folder name for a ride."""
-        ride_lower = ride_name.lower()
-
-        for pattern, folder in RIDE_IMAGE_MAP.items():
-            if pattern in ride_lower:
-                return folder
-
-        return "generic"
-
-    def _load_images_from_folder(self, folder: str) -> list[pygame.Surface]:
-        """Load all images from a folder."""
-        folder_path = IMAGES_DIR / folder
-
-        if not folder_path.exists():
-            logger.debug(f"Image folder not found: {folder}")
+        return _folder_for_ride(ride_name.lower())
+
+    @staticmethod
+    def _convert_for_display(img: pygame.Surface) -> Optional[pygame.Surface]:
+        """Convert a loaded image to the display's pixel format.
+
+        Images with per-pixel alpha keep it; opaque ones (JPEGs, RGB PNGs)
+        are converted without. Conversion is skipped below 24 bits per pixel,
+        where smoothscale would no longer accept the converted surface.
+
+        Returns:
+            The converted surface, or None if no display mode is set yet
+        """
+        display = pygame.display.get_surface()
+        if display is None or display.get_bitsize() < 24:
+            return None
+        if img.get_flags() & pygame.SRCALPHA:
+            return img.convert_alpha()
+        return img.convert()
+
+    def _prepare_image(self, img: pygame.Surface) -> tuple[pygame.Surface, bool]:
+        """Convert and (if prescaling) scale a freshly loaded image.
+
+        Returns:
+            Tuple of (surface, converted); only the prepared surface is kept,
+            so large source images don't stay resident
+        """
+        display_img = self._convert_for_display(img)
+        if display_img is not None:
+            img = display_img
+
+        return self._scale_to_target(img), display_img is not None
+
+    def _scale_to_target(self, img: pygame.Surface) -> pygame.Surface:
+        """Scale an image to target_size if prescaling and not already sized."""
+        if self.prescale and img.get_size() != self.target_size:
+            try:
+                return pygame.transform.smoothscale(img, self.target_size)
+            except ValueError as e:
+                # e.g. palette images before conversion; callers scale instead
+                logger.debug("Could not prescale image: %s", e)
+        return img
+
+    def _read_folder(self, folder: str) -> list[tuple[str, pygame.Surface]]:
+        """Decode (and prescale) a folder's images without converting them.
+
+        Changes no manager state and needs no display, so folders can be
+        read on worker threads.
+
+        Returns:
+            (path, surface) pairs in cycle order; empty if no folder
+        """
+        # One directory pass, filtering by extension; sorted so the image
+        # cycle order is stable
+        try:
+            with os.scandir(IMAGES_DIR / folder) as entries:
+                img_paths = sorted(
+                    entry.path for entry in entries
+                    if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+                    and entry.is_file()
+                )
+        except FileNotFoundError:
+            logger.debug("Image folder not found: %s", folder)
             return []
 
+        decoded = []
+        for img_path in img_paths:
+            try:
+                img = pygame.image.load(img_path)
+            except pygame.error as e:
+                logger.warning("Failed to load image %s: %s", img_path, e)
+                continue
+            # Scaling first leaves less to convert, and frees the source
+            decoded.append((img_path, self._scale_to_target(img)))
+        return decoded
+
+    def _load_images_from_folder(
+        self,
+        folder: str,
+        decoded: Optional[list[tuple[str, pygame.Surface]]] = None,
+    ) -> list[pygame.Surface]:
+        """Load all images from a folder.
+
+        Args:
+            folder: Image folder name
+            decoded: The folder's _read_folder() result, if already read
+        """
+        if decoded is None:
+            decoded = self._read_folder(folder)
+
         images = []
-        for ext in ["*.png", "*.jpg", "*.jpeg", "*.webp"]:
-            for img_path in folder_path.glob(ext):
-                try:
-                    img = pygame.image.load(str(img_path))
-                    images.append(img)
-                    logger.debug(f"Loaded image: {img_path.name}")
-                except pygame.error as e:
-                    logger.warning(f"Failed to load image {img_path}: {e}")
+        converted = True
+        for img_path, img in decoded:
+            # Convert once here so blits don't on every frame
+            img, img_converted = self._prepare_image(img)
+            converted = converted and img_converted
+            images.append(img)
+            logger.debug("Loaded image: %s", os.path.basename(img_path))
 
         if images:
-            logger.info(f"Loaded {len(images)} images from {folder}")
+            logger.info("Loaded %d images from %s", len(images), folder)
+            if not converted:
+                self._unconverted.add(folder)
 
         return images
 
     def _create_placeholder(self, ride_name: str, theme: str) -> pygame.Surface:
         """Create a visually interesting placeholder image."""
         colors = get_color_scheme(theme)
-        surface = pygame.Surface(SCREEN_SIZE, pygame.SRCALPHA)
+        # Ride cards are converted to an opaque format, which keeps a drawn
+        # pixel's color and drops its alpha, so only themes that write the
+        # alpha plane directly need an alpha canvas; the rest render the
+        # same card from a cheaper opaque one
+        flags = pygame.SRCALPHA if theme in _ALPHA_THEMES else 0
+        surface = pygame.Surface(self.target_size, flags)
 
         # Create base gradient
         self._draw_gradient(surface, colors.background, colors.accent)
 
-        # Add theme-specific visual elements
-        self._draw_theme_elements(surface, theme, colors)
+        # Add theme-specific visual elements; one generator per placeholder,
+        # sampled in batches
+        rng = np.random.default_rng()
+        self._draw_theme_elements(surface, theme, colors, rng)
 
-        return surface
+        converted = self._convert_for_display(surface)
+        return converted if converted is not None else surface
 
     def _draw_gradient(self, surface: pygame.Surface, color1: tuple, color2: tuple):
         """Draw a diagonal gradient background."""
         width, height = surface.get_size()
 
-        for y in range(height):
-            for x in range(width):
-                # Diagonal gradient with some variation
-                ratio = (x + y) / (width + height)
-                noise = math.sin(x * 0.02) * 0.05 + math.sin(y * 0.03) * 0.05
-
-                r = int(color1[0] * (1 - ratio) + color2[0] * ratio * 0.4)
-                g = int(color1[1] * (1 - ratio) + color2[1] * ratio * 0.4)
-                b = int(color1[2] * (1 - ratio) + color2[2] * ratio * 0.4)
-
-                # Clamp values
-                r = max(0, min(255, r))
-                g = max(0, min(255, g))
-                b = max(0, min(255, b))
-
-                surface.set_at((x, y), (r, g, b, 255))
-
-    def _draw_theme_elements(self, surface: pygame.Surface, theme: str, colors):
+        surface.fill((0, 0, 0, 255))
+        pixels = pygame.surfarray.pixels3d(surface)
+
+        if NUMBA_AVAILABLE:
+            _fill_gradient(pixels, *color1, *color2)
+            del pixels  # Unlock surface
+            return
+
+        # Diagonal gradient ratio for every pixel, in surfarray (x, y) order
+        ratio = (
+            np.arange(width, dtype=np.float64)[:, None]
+            + np.arange(height, dtype=np.float64)[None, :]
+        ) / (width + height)
+
+        for c in range(3):
+            channel = color1[c] * (1 - ratio) + color2[c] * ratio * 0.4
+            np.clip(channel, 0, 255, out=channel)
+            # Unsafe cast truncates like int()
+            np.copyto(pixels[:, :, c], channel, casting="unsafe")
+        del pixels  # Unlock surface
+
+    def _draw_theme_elements(
+        self, surface: pygame.Surface, theme: str, colors, rng: np.random.Generator
+    ):
         """Draw decorative elements based on theme."""
         width, height = surface.get_size()
 
         if theme == "scifi":
-            # Futuristic grid lines and circles
-            for i in range(0, width, 80):
-                alpha = 40 + random.randint(0, 20)
-                pygame.draw.line(surface, (*colors.accent, alpha), (i, 0), (i, height), 1)
-            for i in range(0, height, 60):
-                alpha = 40 + random.randint(0, 20)
-                pygame.draw.line(surface, (*colors.accent, alpha), (0, i), (width, i), 1)
+            # Futuristic grid lines and circles, written as two strided
+            # slices per plane rather than a draw call per line; rows go
+            # last so they own the crossings, as when drawn in this order
+            col_alphas = rng.integers(40, 61, len(range(0, width, 80)))
+            row_alphas = rng.integers(40, 61, len(range(0, height, 60)))
+            pixels = pygame.surfarray.pixels3d(surface)
+            pixels[::80, :] = colors.accent
+            pixels[:, ::60] = colors.accent
+            del pixels  # Unlock surface
+            alpha = pygame.surfarray.pixels_alpha(surface)
+            alpha[::80, :] = col_alphas[:, None]
+            alpha[:, ::60] = row_alphas[None, :]
+            del alpha
 
             # Glowing orbs
-            for _ in range(5):
-                x = random.randint(100, width - 100)
-                y = random.randint(100, height - 100)
+            n = 5
+            for x, y in zip(
+                rng.integers(100, width - 99, n).tolist(),
+                rng.integers(100, height - 99, n).tolist(),
+            ):
                 for r in range(60, 10, -10):
                     alpha = int(30 * (60 - r) / 50)
                     pygame.draw.circle(surface, (*colors.accent, alpha), (x, y), r)
 
         elif theme == "spooky":
             # Eerie fog/mist effect
-            for _ in range(15):
-                x = random.randint(-50, width)
-                y = random.randint(height // 2, height)
-                w = random.randint(100, 300)
-                h = random.randint(30, 80)
+            n = 15
+            for x, y, w, h in zip(
+                rng.integers(-50, width + 1, n).tolist(),
+                rng.integers(height // 2, height + 1, n).tolist(),
+                rng.integers(100, 301, n).tolist(),
+                rng.integers(30, 81, n).tolist(),
+            ):
+                # Alpha fades out down the patch, one value per row
                 fog = pygame.Surface((w, h), pygame.SRCALPHA)
-                for fy in range(h):
-                    alpha = int(25 * (1 - fy / h))
-                    pygame.draw.line(fog, (150, 100, 150, alpha), (0, fy), (w, fy))
+                fog.fill((150, 100, 150, 0))
+                alphas = 25 * (1 - np.arange(h) / h)
+                fog_alpha = pygame.surfarray.pixels_alpha(fog)
+                np.copyto(fog_alpha, alphas[None, :], casting="unsafe")
+                del fog_alpha  # Unlock surface
                 surface.blit(fog, (x, y))
 
             # Ghostly vertical streaks
-            for _ in range(8):
-                x = random.randint(0, width)
-                h = random.randint(100, 300)
+            n = 8
+            for x, h in zip(
+                rng.integers(0, width + 1, n).tolist(),
+                rng.integers(100, 301, n).tolist(),
+            ):
                 for offset in range(-5, 6):
                     alpha = 20 - abs(offset) * 3
                     pygame.draw.line(
@@ -257,145 +458,210 @@ class ImageManager:
 
         elif theme == "starwars":
             # Star field
-            for _ in range(150):
-                x = random.randint(0, width)
-                y = random.randint(0, height)
-                brightness = random.randint(100, 255)
-                size = random.choice([1, 1, 1, 2])
+            n = 150
+            for x, y, brightness, size in zip(
+                rng.integers(0, width + 1, n).tolist(),
+                rng.integers(0, height + 1, n).tolist(),
+                rng.integers(100, 256, n).tolist(),
+                rng.choice((1, 1, 1, 2), n).tolist(),
+            ):
                 pygame.draw.circle(surface, (brightness, brightness, brightness), (x, y), size)
 
             # Hyperspace streaks
             cx, cy = width // 2, height // 2
-            for _ in range(30):
-                angle = random.uniform(0, 2 * math.pi)
-                length = random.randint(50, 200)
-                start_dist = random.randint(50, 150)
-                x1 = cx + int(math.cos(angle) * start_dist)
-                y1 = cy + int(math.sin(angle) * start_dist)
-                x2 = cx + int(math.cos(angle) * (start_dist + length))
-                y2 = cy + int(math.sin(angle) * (start_dist + length))
-                pygame.draw.line(surface, (*colors.accent, 100), (x1, y1), (x2, y2), 2)
+            n = 30
+            angles = rng.uniform(0, 2 * math.pi, n)
+            lengths = rng.integers(50, 201, n)
+            start_dists = rng.integers(50, 151, n)
+            cos, sin = np.cos(angles), np.sin(angles)
+            end_dists = start_dists + lengths
+            streak_color = _alpha_colors(colors.accent)[100]
+            for x1, y1, x2, y2 in zip(
+                (cx + (cos * start_dists).astype(int)).tolist(),
+                (cy + (sin * start_dists).astype(int)).tolist(),
+                (cx + (cos * end_dists).astype(int)).tolist(),
+                (cy + (sin * end_dists).astype(int)).tolist(),
+            ):
+                pygame.draw.line(surface, streak_color, (x1, y1), (x2, y2), 2)
 
         elif theme == "avatar":
             # Bioluminescent plants
-            for _ in range(40):
-                x = random.randint(0, width)
-                y = random.randint(height // 3, height)
+            n = 40
+            for x, y, h in zip(
+                rng.integers(0, width + 1, n).tolist(),
+                rng.integers(height // 3, height + 1, n).tolist(),
+                rng.integers(40, 151, n).tolist(),
+            ):
                 # Glowing stem
-                h = random.randint(40, 150)
-                for i in range(h):
-                    alpha = int(60 * (1 - i / h))
-                    sway = int(math.sin(i * 0.1) * 5)
-                    pygame.draw.circle(
-                        surface, (*colors.accent, alpha),
-                        (x + sway, y - i), 2
-                    )
+                self._draw_stem(surface, x, y, h, colors.accent)
                 # Glowing top
                 for r in range(15, 3, -2):
                     alpha = int(80 * (15 - r) / 12)
                     pygame.draw.circle(surface, (*colors.accent, alpha), (x, y - h), r)
 
         elif theme == "pirate":
-            # Waves
-            for wave_y in range(height - 100, height, 20):
-                points = []
-                for x in range(0, width + 20, 20):
-                    y_offset = int(math.sin(x * 0.03 + wave_y * 0.1) * 10)
-                    points.append((x, wave_y + y_offset))
-                if len(points) >= 2:
-                    pygame.draw.lines(surface, (*colors.accent, 60), False, points, 2)
+            # Waves: every point of every wave at once, (waves, points, 2)
+            xs = np.arange(0, width + 20, 20)
+            wave_ys = np.arange(height - 100, height, 20)
+            offsets = (np.sin(xs * 0.03 + wave_ys[:, None] * 0.1) * 10).astype(int)
+            waves = np.stack(
+                (np.broadcast_to(xs, offsets.shape), wave_ys[:, None] + offsets),
+                axis=-1,
+            )
+            wave_color = (*colors.accent, 60)
+            for points in waves.tolist():
+                pygame.draw.lines(surface, wave_color, False, points, 2)
 
             # Coins/treasure sparkles
-            for _ in range(20):
-                x = random.randint(50, width - 50)
-                y = random.randint(50, height - 50)
-                pygame.draw.circle(surface, (*colors.accent, 150), (x, y), 4)
-                pygame.draw.circle(surface, (255, 255, 200, 100), (x - 1, y - 1), 2)
+            n = 20
+            coin = (*colors.accent, 150)
+            glint = (255, 255, 200, 100)
+            for x, y in zip(
+                rng.integers(50, width - 49, n).tolist(),
+                rng.integers(50, height - 49, n).tolist(),
+            ):
+                pygame.draw.circle(surface, coin, (x, y), 4)
+                pygame.draw.circle(surface, glint, (x - 1, y - 1), 2)
 
         elif theme in ["whimsical", "playful"]:
             # Floating bubbles/circles
-            for _ in range(25):
-                x = random.randint(0, width)
-                y = random.randint(0, height)
-                r = random.randint(20, 60)
+            n = 25
+            for x, y, r in zip(
+                rng.integers(0, width + 1, n).tolist(),
+                rng.integers(0, height + 1, n).tolist(),
+                rng.integers(20, 61, n).tolist(),
+            ):
                 pygame.draw.circle(surface, (*colors.accent, 40), (x, y), r)
                 pygame.draw.circle(surface, (*colors.accent, 80), (x, y), r, 2)
 
             # Confetti
-            for _ in range(50):
-                x = random.randint(0, width)
-                y = random.randint(0, height)
-                w = random.randint(5, 15)
-                h = random.randint(5, 15)
-                color = random.choice([
-                    (*colors.accent, 100),
-                    (255, 200, 100, 100),
-                    (100, 200, 255, 100),
-                ])
-                pygame.draw.rect(surface, color, (x, y, w, h))
+            confetti_colors = [
+                (*colors.accent, 100),
+                (255, 200, 100, 100),
+                (100, 200, 255, 100),
+            ]
+            n = 50
+            for x, y, w, h, color_idx in zip(
+                rng.integers(0, width + 1, n).tolist(),
+                rng.integers(0, height + 1, n).tolist(),
+                rng.integers(5, 16, n).tolist(),
+                rng.integers(5, 16, n).tolist(),
+                rng.integers(0, len(confetti_colors), n).tolist(),
+            ):
+                pygame.draw.rect(surface, confetti_colors[color_idx], (x, y, w, h))
 
         elif theme == "fantasy":
             # Sparkles/fairy dust
-            for _ in range(60):
-                x = random.randint(0, width)
-                y = random.randint(0, height)
-                # Four-pointed star
-                size = random.randint(3, 10)
-                alpha = random.randint(80, 200)
-                points = [
-                    (x, y - size), (x + 2, y),
-                    (x + size, y), (x + 2, y + 2),
-                    (x, y + size), (x - 2, y + 2),
-                    (x - size, y), (x - 2, y)
-                ]
-                pygame.draw.polygon(surface, (*colors.accent, alpha), points)
+            n = 60
+            accents = _alpha_colors(colors.accent)
+            centers = np.stack(
+                (rng.integers(0, width + 1, n), rng.integers(0, height + 1, n)),
+                axis=1,
+            )
+            sizes = rng.integers(3, 11, n)
+            alphas = rng.integers(80, 201, n)
+            # Four-pointed stars, all outlines at once: (n, 8, 2) points
+            stars = (
+                centers[:, None, :]
+                + _STAR_FIXED
+                + sizes[:, None, None] * _STAR_SCALED
+            )
+            for points, alpha in zip(stars.tolist(), alphas.tolist()):
+                pygame.draw.polygon(surface, accents[alpha], points)
 
         elif theme == "adventure":
-            # Jungle vines/leaves
-            for _ in range(10):
-                x = random.randint(0, width)
-                # Hanging vine
-                points = [(x, 0)]
-                y = 0
-                while y < height * 0.7:
-                    y += random.randint(20, 40)
-                    x += random.randint(-20, 20)
-                    points.append((x, y))
-                if len(points) >= 2:
-                    pygame.draw.lines(surface, (*colors.accent, 80), False, points, 3)
+            # Jungle vines/leaves: each hanging vine walks down in random
+            # steps until it passes 70% of the height. Steps are drawn for
+            # the longest possible walk and cut where each vine ends.
+            n = 10
+            limit = height * 0.7
+            max_steps = max(math.ceil(limit / 20), 1)
+            starts = rng.integers(0, width + 1, n)
+            step_ys = np.cumsum(rng.integers(20, 41, (n, max_steps)), axis=1)
+            step_xs = starts[:, None] + np.cumsum(rng.integers(-20, 21, (n, max_steps)), axis=1)
+            vine_color = (*colors.accent, 80)
+            for x, xs, ys in zip(starts.tolist(), step_xs, step_ys):
+                # Steps up to and including the first one past the limit
+                end = np.searchsorted(ys, limit) + 1
+                points = [(x, 0)] + np.stack((xs[:end], ys[:end]), axis=1).tolist()
+                pygame.draw.lines(surface, vine_color, False, points, 3)
 
             # Scattered leaves
-            for _ in range(30):
-                x = random.randint(0, width)
-                y = random.randint(0, height)
-                pygame.draw.ellipse(
-                    surface, (*colors.accent, 60),
-                    (x, y, random.randint(10, 25), random.randint(5, 12))
-                )
+            n = 30
+            leaf_color = (*colors.accent, 60)
+            for x, y, w, h in zip(
+                rng.integers(0, width + 1, n).tolist(),
+                rng.integers(0, height + 1, n).tolist(),
+                rng.integers(10, 26, n).tolist(),
+                rng.integers(5, 13, n).tolist(),
+            ):
+                pygame.draw.ellipse(surface, leaf_color, (x, y, w, h))
 
         else:  # classic/default
             # Subtle Disney-esque sparkle pattern
-            for _ in range(40):
-                x = random.randint(0, width)
-                y = random.randint(0, height)
-                size = random.randint(2, 6)
-                pygame.draw.circle(surface, (*colors.accent, 80), (x, y), size)
-                pygame.draw.circle(surface, (255, 255, 255, 40), (x, y), size + 2)
+            n = 40
+            sparkle = _alpha_colors(colors.accent)[80]
+            halo = _alpha_colors((255, 255, 255))[40]
+            for x, y, size in zip(
+                rng.integers(0, width + 1, n).tolist(),
+                rng.integers(0, height + 1, n).tolist(),
+                rng.integers(2, 7, n).tolist(),
+            ):
+                pygame.draw.circle(surface, sparkle, (x, y), size)
+                pygame.draw.circle(surface, halo, (x, y), size + 2)
+
+    @staticmethod
+    def _draw_stem(surface: pygame.Surface, x: int, y: int, h: int, color: tuple):
+        """Draw a swaying, fading stem of small circles rising from (x, y).
+
+        Writes the same pixels as drawing each circle with pygame.draw in
+        turn: circles are written (not blended), so where they overlap the
+        last, highest and faintest, one wins.
+        """
+        width, height = surface.get_size()
+        i = np.arange(h)
+        alphas = (60 * (1 - i / h)).astype(np.int16)
+        sway = (np.sin(i * 0.1) * 5).astype(np.int64)  # Truncates like int()
+
+        # Stamp every circle into a small canvas around the stem; alpha only
+        # falls as the stem rises, so the minimum is the last write
+        x0, y0 = x + int(sway.min()) - 2, y - h - 1
+        canvas = np.full(
+            (int(sway.max() - sway.min()) + 5, h + 4), 256, dtype=np.int16
+        )
+        np.minimum.at(
+            canvas,
+            (
+                (x - x0 + sway[:, None] + _STEM_DX[None, :]).ravel(),
+                (y - y0 - i[:, None] + _STEM_DY[None, :]).ravel(),
+            ),
+            np.repeat(alphas, len(_STEM_DX)),
+        )
+
+        # Clip the canvas to the surface
+        cx0, cy0 = max(x0, 0), max(y0, 0)
+        cx1 = min(x0 + canvas.shape[0], width)
+        cy1 = min(y0 + canvas.shape[1], height)
+        if cx0 >= cx1 or cy0 >= cy1:
+            return
+        canvas = canvas[cx0 - x0:cx1 - x0, cy0 - y0:cy1 - y0]
+        covered = canvas < 256
+
+        pixels = pygame.surfarray.pixels3d(surface)
+        pixels[cx0:cx1, cy0:cy1][covered] = color
+        del pixels  # Unlock surface
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[cx0:cx1, cy0:cy1][covered] = canvas[covered]
+        del alpha
 
     def get_image(self, ride_name: str, theme: str) -> pygame.Surface:
         """Get an image for a ride (does not auto-cycle)."""
         folder = self._get_folder_for_ride(ride_name)
-
-        # Load images if not cached
-        if folder not in self._image_cache:
-            self._image_cache[folder] = self._load_images_from_folder(folder)
-            self._cycle_index[folder] = 0
-
-        images = self._image_cache[folder]
+        images = self._get_folder_images(folder)
 
         # If we have real images, return current one (no auto-cycle)
         if images:
-            idx = self._cycle_index[folder]
+            idx = self._cycle_index[folder] % len(images)
             return images[idx]
 
         # Otherwise return a placeholder
@@ -405,6 +671,50 @@ class ImageManager:
 
         return self._placeholder_cache[cache_key]
 
+    def _get_folder_images(
+        self,
+        folder: str,
+        decoded: Optional[list[tuple[str, pygame.Surface]]] = None,
+    ) -> list[pygame.Surface]:
+        """Return a folder's images, loading them if not cached.
+
+        Args:
+            folder: Image folder name
+            decoded: The folder's _read_folder() result, if already read
+        """
+        images = self._image_cache.get(folder)
+        if images is None:
+            images = self._image_cache[folder] = self._load_images_from_folder(
+                folder, decoded
+            )
+            # Keep the cycle position of folders reloaded after eviction
+            self._cycle_index.setdefault(folder, 0)
+            self._evict()
+        else:
+            self._image_cache.move_to_end(folder)
+
+        if folder in self._unconverted:
+            self._convert_folder(folder)
+            images = self._image_cache[folder]
+        return images
+
+    def _evict(self) -> None:
+        """Drop least recently used folders beyond max_cached_folders."""
+        if self.max_cached_folders is None:
+            return
+        while len(self._image_cache) > self.max_cached_folders:
+            folder, _ = self._image_cache.popitem(last=False)
+            self._unconverted.discard(folder)
+            logger.debug("Evicted images for %s", folder)
+
+    def _convert_folder(self, folder: str) -> None:
+        """Convert a folder's images loaded before the display existed."""
+        prepared = [self._prepare_image(img) for img in self._image_cache[folder]]
+        if not all(converted for _, converted in prepared):
+            return  # Still no display mode; try again next time
+        self._image_cache[folder] = [img for img, _ in prepared]
+        self._unconverted.discard(folder)
+
     def advance_all_cycles(self):
         """Advance image cycle for all rides. Call after a full round of rides."""
         for folder in self._cycle_index:
@@ -414,6 +724,33 @@ class ImageManager:
 
     def get_park_image(self, park_slug: str) -> Optional[pygame.Surface]:
         """Get an image for a park (for closed park displays)."""
+        if park_slug in self._park_image_cache:
+            return self._park_image_cache[park_slug]
+
+        image_path = self._get_park_image_path(park_slug)
+        if image_path is None:
+            self._park_image_cache[park_slug] = None
+            return None
+
+        try:
+            img = pygame.image.load(str(image_path))
+            logger.debug("Loaded park image: %s", park_slug)
+        except pygame.error as e:
+            logger.warning("Failed to load park image %s: %s", park_slug, e)
+            return None
+
+        img, converted = self._prepare_image(img)
+        # Loaded before the display was set up: not cached, so the next
+        # call loads and converts it again
+        if converted:
+            self._park_image_cache[park_slug] = img
+        return img
+
+    def _get_park_image_path(self, park_slug: str) -> Optional[Path]:
+        """Find a park's image file, checking the filesystem once per park."""
+        if park_slug in self._park_path_cache:
+            return self._park_path_cache[park_slug]
+
         parks_dir = IMAGES_DIR / "parks"
         image_path = parks_dir / f"{park_slug}.png"
 
@@ -421,34 +758,39 @@ class ImageManager:
             # Try jpg
             image_path = parks_dir / f"{park_slug}.jpg"
 
-        if image_path.exists():
-            try:
-                img = pygame.image.load(str(image_path))
-                logger.debug(f"Loaded park image: {park_slug}")
-                return img
-            except pygame.error as e:
-                logger.warning(f"Failed to load park image {park_slug}: {e}")
-
-        return None
+        resolved = image_path if image_path.exists() else None
+        self._park_path_cache[park_slug] = resolved
+        return resolved
 
     def preload_all(self):
         """Preload images for all mapped rides."""
         folders = set(RIDE_IMAGE_MAP.values())
         folders.add("generic")
 
-        for folder in folders:
-            if folder not in self._image_cache:
-                self._image_cache[folder] = self._load_images_from_folder(folder)
-                self._cycle_index[folder] = 0
+        if self.max_cached_folders is not None:
+            # Loading more than fit would only evict earlier folders
+            folders = sorted(folders)[:self.max_cached_folders]
+
+        # Decode and scale on worker threads (SDL releases the GIL while
+        # decoding and scaling); convert and cache back on this thread
+        pending = [folder for folder in folders if folder not in self._image_cache]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for folder, decoded in zip(pending, executor.map(self._read_folder, pending)):
+                self._get_folder_images(folder, decoded)
 
 
 # Global image manager instance
 _image_manager: Optional[ImageManager] = None
 
 
-def get_image_manager() -> ImageManager:
-    """Get the global ImageManager instance."""
+def get_image_manager(target_size: tuple[int, int] = SCREEN_SIZE) -> ImageManager:
+    """Get the global ImageManager instance.
+
+    Args:
+        target_size: Display size to prescale images to when the instance
+            is first created
+    """
     global _image_manager
     if _image_manager is None:
-        _image_manager = ImageManager()
+        _image_manager = ImageManager(target_size=target_size)
     return _image_manager
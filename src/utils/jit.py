@@ -0,0 +1,28 @@
+"""Optional Numba JIT support.
+
+Numba is not a required dependency. When it is installed, ``njit`` and
+``prange`` are re-exported from it; otherwise ``njit`` leaves functions
+untouched and ``prange`` is plain ``range``. Callers check
+``NUMBA_AVAILABLE`` to choose between a compiled kernel and a NumPy path.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit``.
+
+        Supports both the bare ``@njit`` and the ``@njit(...)`` forms.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
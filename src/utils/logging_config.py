@@ -1,9 +1,23 @@
 """Logging configuration with file rotation."""
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
+
+# Writes log records to their handlers on a background thread
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background log writer."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def setup_logging(
@@ -15,6 +29,9 @@ def setup_logging(
 ) -> logging.Logger:
     """Configure application logging with file rotation.
 
+    Loggers only enqueue records; file and console output happen on a
+    background thread, so logging calls don't block on disk I/O.
+
     Args:
         log_file: Path to log file
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
@@ -38,11 +55,17 @@ def setup_logging(
         datefmt="%H:%M:%S",
     )
 
+    # Records don't need thread/process details the formats never show
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
-    # Clear any existing handlers
+    # Clear any existing handlers (and the writer from an earlier call)
+    _stop_listener()
     root_logger.handlers.clear()
 
     # File handler with rotation
@@ -57,14 +80,21 @@ def setup_logging(
     )
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(file_handler)
+    handlers = [file_handler]
 
     # Console handler (optional)
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(numeric_level)
         console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    # Route records through a queue to the handlers above
+    global _listener
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     # Reduce noise from libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -73,6 +103,10 @@ def setup_logging(
     return root_logger
 
 
+# Runs before logging's own shutdown hook, which was registered earlier
+atexit.register(_stop_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the given name.
 
@@ -0,0 +1,59 @@
+"""First-match substring lookup over ordered pattern tables."""
+
+from typing import Generic, Mapping, Optional, TypeVar
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+T = TypeVar("T")
+
+
+class PatternMatcher(Generic[T]):
+    """Find the value of the first pattern, in table order, found in a text.
+
+    Equivalent to scanning ``table.items()`` and returning the value of the
+    first pattern that is a substring of the text. With pyahocorasick
+    installed, every pattern is tested in a single pass over the text using
+    an Aho-Corasick automaton; otherwise the table is scanned in order.
+    """
+
+    def __init__(self, table: Mapping[str, T]):
+        """Build the matcher.
+
+        Args:
+            table: Ordered mapping of substring pattern to value
+        """
+        self._table = tuple(table.items())
+        self._automaton = None
+
+        if ahocorasick is not None and self._table:
+            automaton = ahocorasick.Automaton()
+            # Store each pattern's table position so the earliest rule wins
+            for priority, (pattern, value) in enumerate(self._table):
+                automaton.add_word(pattern, (priority, value))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def match(self, text: str, default: Optional[T] = None) -> Optional[T]:
+        """Return the value of the first matching pattern.
+
+        Args:
+            text: Text to search (patterns are matched case-sensitively)
+            default: Value returned when no pattern matches
+
+        Returns:
+            Value of the earliest table pattern contained in text, or default
+        """
+        if self._automaton is not None:
+            best = None
+            for _, (priority, value) in self._automaton.iter(text):
+                if best is None or priority < best[0]:
+                    best = (priority, value)
+            return best[1] if best is not None else default
+
+        for pattern, value in self._table:
+            if pattern in text:
+                return value
+        return default
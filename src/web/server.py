@@ -3,23 +3,135 @@
 import logging
 import threading
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 from flask import Flask, render_template, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 
 from src.data.database import get_database
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson.
+
+    Output matches the default provider: keys are sorted, and types orjson
+    leaves to it (dates, Decimal, UUID, ...) use Flask's own conversions.
+    Calls with extra json.dumps options fall back to the default encoder.
+    """
+
+    _OPTIONS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    ) if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping a decode
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self._OPTIONS),
+            mimetype=self.mimetype,
+        )
+
+
 # Create Flask app
 app = Flask(__name__, template_folder='templates')
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+# Compress pages and API responses for clients that accept it
+if Compress is not None:
+    app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+    app.config["COMPRESS_MIN_SIZE"] = 512
+    Compress(app)
 
 # Database reference (set during initialization)
 _db = None
 
+# Query results by name, as (waits_version, data); each is reused until
+# the database's wait data changes. One lock per name, so a miss on one
+# query never waits behind another.
+_query_cache: dict[str, tuple] = {}
+_query_locks: dict[str, threading.Lock] = {}
+
 
 def init_app(database):
     """Initialize the web app with database."""
     global _db
     _db = database
+    _query_cache.clear()
+
+    # Warm the lists every page needs
+    _get_all_parks()
+    _get_all_rides()
+
+
+def _cached_query(name: str, query):
+    """Run a database query, reusing its result until wait data changes.
+
+    Concurrent requests for the same query share one database hit per
+    update; different queries run independently. Results are shared
+    between requests and must not be modified.
+
+    Args:
+        name: Cache key for the query
+        query: Zero-argument callable that runs the query
+
+    Returns:
+        The query's result
+    """
+    version = _db.waits_version
+    # setdefault is atomic, so racing first calls still share one lock
+    lock = _query_locks.setdefault(name, threading.Lock())
+    with lock:
+        cached = _query_cache.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        data = query()
+        _query_cache[name] = (version, data)
+        return data
+
+
+def _get_current_waits() -> list[dict]:
+    """Get the most recent wait times."""
+    return _cached_query("current_waits", _db.get_current_waits)
+
+
+def _get_all_parks() -> list[str]:
+    """Get the names of all parks with recorded waits."""
+    return _cached_query("all_parks", _db.get_all_parks)
+
+
+def _get_all_rides() -> list[str]:
+    """Get the names of all rides with recorded waits."""
+    return _cached_query("all_rides", _db.get_all_rides)
 
 
 @app.route('/')
@@ -28,16 +140,14 @@ def index():
     if not _db:
         return "Database not initialized", 500
 
-    current_waits = _db.get_current_waits()
-    parks = _db.get_all_parks()
+    current_waits = _get_current_waits()
+    parks = _get_all_parks()
 
-    # Group waits by park
-    waits_by_park = {}
-    for wait in current_waits:
-        park = wait['park_name']
-        if park not in waits_by_park:
-            waits_by_park[park] = []
-        waits_by_park[park].append(wait)
+    # Group waits by park (rows come back ordered by park_name)
+    waits_by_park = {
+        park: list(waits)
+        for park, waits in groupby(current_waits, key=itemgetter('park_name'))
+    }
 
     return render_template('index.html',
                            waits_by_park=waits_by_park,
@@ -51,8 +161,8 @@ def trends():
     if not _db:
         return "Database not initialized", 500
 
-    rides = _db.get_all_rides()
-    parks = _db.get_all_parks()
+    rides = _get_all_rides()
+    parks = _get_all_parks()
     stats = _db.get_database_stats()
 
     return render_template('trends.html',
@@ -86,7 +196,7 @@ def api_current_waits():
     if not _db:
         return jsonify({'error': 'Database not initialized'}), 500
 
-    waits = _db.get_current_waits()
+    waits = _get_current_waits()
     return jsonify({
         'timestamp': datetime.now().isoformat(),
         'waits': waits
@@ -147,7 +257,7 @@ def api_all_rides():
     if not _db:
         return jsonify({'error': 'Database not initialized'}), 500
 
-    rides = _db.get_all_rides()
+    rides = _get_all_rides()
     return jsonify({'rides': rides})
 
 
@@ -157,7 +267,7 @@ def api_all_parks():
     if not _db:
         return jsonify({'error': 'Database not initialized'}), 500
 
-    parks = _db.get_all_parks()
+    parks = _get_all_parks()
     return jsonify({'parks': parks})
 
 
@@ -183,6 +293,11 @@ def run_server(host='0.0.0.0', port=8080, database=None):
         init_app(database)
 
     def run():
+        if serve is not None:
+            # Production WSGI server; polls are handled by a thread pool
+            serve(app, host=host, port=port, threads=8, _quiet=True)
+            return
+
         # Suppress Flask's default logging in production
         import logging as flask_logging
         flask_log = flask_logging.getLogger('werkzeug')